@@ -1,6 +1,7 @@
+from functools import cached_property
 from pathlib import Path
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, validator
 
 
 class Settings(BaseSettings):
@@ -13,17 +14,39 @@ class Settings(BaseSettings):
     # Directory settings
     upload_dir: Path = Path("temp/uploads")
     output_dir: Path = Path("temp/output")
+    # Stems of earlier separations (hard links), keyed by upload content hash
+    result_cache_dir: Path = Path("temp/cache")
 
     # File validation settings
-    allowed_extensions: set[str] = {".mp3", ".wav", ".ogg", ".flac", ".m4a"}
+    # Lowercase, dot-prefixed; callers must lowercase the suffix before a lookup
+    allowed_extensions: frozenset[str] = frozenset({".mp3", ".wav", ".ogg", ".flac", ".m4a"})
     max_file_size_mb: int = 100
-    max_file_size_bytes: int = 100 * 1024 * 1024  # 100MB default
 
     # Rate limiting settings
     rate_limit_per_minute: int = 30
+    # Rate limit by X-Forwarded-For; enable only behind a proxy that sets the header
+    trust_forwarded_for: bool = False
+    # Trusted proxies in front of the app; each appends one X-Forwarded-For entry, so
+    # the client address is this many entries from the right
+    forwarded_for_hops: int = 1
 
     # Processing settings
     max_concurrent_separations: int = 3
+    # Queued separations with the same stem count handed to a worker in one call
+    max_separation_batch_size: int = 4
+    # Result zip compression: "stored" (no compression) or "deflated" (WAV stems only)
+    zip_compression: str = "stored"
+    # Stem audio format: "wav" (16-bit PCM), "flac" (lossless, about half the size) or
+    # lossy "mp3"/"ogg"/"m4a" encoded at stem_bitrate
+    stem_codec: str = "wav"
+    stem_bitrate: str = "128k"
+    # Separated results kept for repeat uploads of the same audio; 0 disables the cache
+    result_cache_size: int = 32
+
+    # Job settings
+    persist_jobs: bool = True  # Journal job state to disk so it survives restarts
+    # Share job state between API processes through Redis (requires the redis package)
+    redis_url: str | None = None
 
     # Server settings
     host: str = "0.0.0.0"
@@ -32,29 +55,55 @@ class Settings(BaseSettings):
     # Logging settings
     log_level: str = "INFO"
     log_file: str = "logs/app.log"
+    # Record per-call timings for /metrics; when off, tracked functions run unwrapped
+    enable_perf_tracking: bool = True
 
     class Config:
         env_file = ".env"
         case_sensitive = False
+        keep_untouched = (cached_property,)
+
+    @validator("upload_dir", "output_dir", "result_cache_dir")
+    def resolve_dir(cls, value: Path) -> Path:
+        """Resolve directory paths to absolute."""
+        return value.resolve()
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Resolve paths to absolute
-        self.upload_dir = self.upload_dir.resolve()
-        self.output_dir = self.output_dir.resolve()
-        # Normalize allowed_extensions to ensure they have dots
+    @validator("allowed_extensions")
+    def normalize_extensions(cls, value: frozenset[str]) -> frozenset[str]:
+        """Ensure every extension is lowercase and starts with a dot."""
         # Pydantic may parse env vars and strip dots, so we normalize here
-        normalized_extensions = set()
-        for ext in self.allowed_extensions:
-            # Ensure extension starts with dot
-            if not ext.startswith("."):
-                normalized_extensions.add(f".{ext}")
-            else:
-                normalized_extensions.add(ext)
-        self.allowed_extensions = normalized_extensions
-        # Calculate max file size from MB setting
-        if self.max_file_size_mb:
-            self.max_file_size_bytes = self.max_file_size_mb * 1024 * 1024
+        return frozenset(f".{ext.lstrip('.')}".lower() for ext in value)
+
+    @validator("zip_compression")
+    def validate_zip_compression(cls, value: str) -> str:
+        """Accept only the supported zip compression modes."""
+        value = value.lower()
+        if value not in ("stored", "deflated"):
+            raise ValueError('zip_compression must be "stored" or "deflated"')
+        return value
+
+    @validator("stem_codec")
+    def validate_stem_codec(cls, value: str) -> str:
+        """Accept only codecs Spleeter can write."""
+        value = value.lower()
+        if value not in ("wav", "flac", "mp3", "ogg", "m4a"):
+            raise ValueError('stem_codec must be one of "wav", "flac", "mp3", "ogg", "m4a"')
+        return value
+
+    @cached_property
+    def allowed_extensions_sorted(self) -> tuple[str, ...]:
+        """Allowed extensions in sorted order, for display."""
+        return tuple(sorted(self.allowed_extensions))
+
+    @cached_property
+    def allowed_extensions_display(self) -> str:
+        """Sorted, comma-separated allowed extensions for error messages."""
+        return ", ".join(self.allowed_extensions_sorted)
+
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """Maximum upload size in bytes, derived from the MB setting."""
+        return self.max_file_size_mb << 20  # MB -> bytes
 
 
 settings = Settings()
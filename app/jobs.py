@@ -1,35 +1,96 @@
 """Job management system for async audio separation processing."""
 
-import json
+import asyncio
+import atexit
+import heapq
 import logging
+import os
+import secrets
+import threading
 import time
-import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 from typing import Any, Union
 
+import orjson
+
 from app.config import settings
 
+# fcntl is Unix-only; without it the journal is assumed to have a single writer
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Directory for persistent job storage
 JOBS_STORAGE_DIR = settings.output_dir.parent / "jobs"
-JOBS_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+# Append-only journal of job records, replayed on startup
+JOURNAL_PATH = JOBS_STORAGE_DIR / "journal.jsonl"
+# Minimum number of journal records before compaction is considered
+JOURNAL_COMPACT_THRESHOLD = 1000
+# How often pending job updates are flushed to the journal (seconds)
+JOURNAL_FLUSH_INTERVAL = 0.5
+# How long a job is kept in Redis after its last update (seconds)
+JOB_TTL_SECONDS = 7200
+# Flags for the journal descriptor: every write lands at the end of the file
+JOURNAL_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+# fdatasync is not available everywhere (e.g. macOS); fall back to fsync
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _read_job_file(job_file: str) -> Union[dict[str, Any], None]:
+    """Read and parse a single legacy per-job file, or return None on failure."""
+    try:
+        with open(job_file, "rb") as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        logger.warning(f"Failed to load job from {job_file}: {e}")
+        return None
 
 
 class JobStatus(str, Enum):
-    """Job status enumeration."""
+    """Job status enumeration.
+
+    Members are str instances, so they can be serialized and formatted directly
+    without going through ``.value``.
+    """
 
     PENDING = "pending"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
 
+    # Format as the plain value (Python 3.12+ would otherwise render "JobStatus.X")
+    __str__ = str.__str__
+
 
 class Job:
     """Represents a separation job."""
 
-    def __init__(self, job_id: str, file_path: Path, stems: int):
+    # Many jobs are retained in memory; slots drop the per-instance __dict__
+    __slots__ = (
+        "job_id",
+        "file_path",
+        "stems",
+        "status",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "error",
+        "result_path",
+        "result_size_bytes",
+        "progress",
+        "_base_dict",
+    )
+
+    def __init__(
+        self, job_id: str, file_path: Path, stems: int, created_at: Union[float, None] = None
+    ):
         """
         Initialize a new job.
 
@@ -37,27 +98,31 @@ class Job:
             job_id: Unique job identifier
             file_path: Path to the uploaded audio file
             stems: Number of stems to separate into
+            created_at: Creation timestamp (defaults to now; set when restoring from disk)
         """
         self.job_id = job_id
         self.file_path = file_path
         self.stems = stems
         self.status = JobStatus.PENDING
-        self.created_at = time.time()
+        self.created_at = created_at if created_at is not None else time.time()
         self.started_at: Union[float, None] = None
         self.completed_at: Union[float, None] = None
         self.error: Union[str, None] = None
         self.result_path: Union[Path, None] = None
+        self.result_size_bytes: Union[int, None] = None  # Cached once the job completes
         self.progress: float = 0.0  # 0.0 to 1.0
+        # Response fields that never change after creation, copied by to_dict
+        self._base_dict: dict[str, Any] = {
+            "job_id": job_id,
+            "stems": stems,
+            "created_at": self.created_at,
+        }
 
     def to_dict(self) -> dict[str, Any]:
         """Convert job to dictionary for API response."""
-        result = {
-            "job_id": self.job_id,
-            "status": self.status.value,
-            "stems": self.stems,
-            "created_at": self.created_at,
-            "progress": self.progress,
-        }
+        result = self._base_dict.copy()
+        result["status"] = self.status
+        result["progress"] = self.progress
 
         if self.started_at:
             result["started_at"] = self.started_at
@@ -68,8 +133,8 @@ class Job:
         if self.status == JobStatus.COMPLETED and self.result_path:
             result["result_url"] = f"/jobs/{self.job_id}/result"
             result["result_size_mb"] = (
-                round(self.result_path.stat().st_size / (1024 * 1024), 2)
-                if self.result_path.exists()
+                round(self.result_size_bytes / (1024 * 1024), 2)
+                if self.result_size_bytes is not None
                 else None
             )
 
@@ -82,6 +147,77 @@ class Job:
         return result
 
 
+def _read_result_size(status: JobStatus, result_path: Union[Path, None]) -> Union[int, None]:
+    """
+    Size of a completed job's result (final once completed, so read only once).
+
+    For a stems directory this is the total size of its files, which the streamed
+    zip exceeds only by its headers.
+    """
+    if result_path and status == JobStatus.COMPLETED:
+        try:
+            if result_path.is_dir():
+                with os.scandir(result_path) as entries:
+                    return sum(
+                        entry.stat().st_size
+                        for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                    )
+            return result_path.stat().st_size
+        except OSError:
+            pass
+    return None
+
+
+async def _read_result_size_async(
+    status: JobStatus, result_path: Union[Path, None]
+) -> Union[int, None]:
+    """_read_result_size, with the directory scan moved off the event loop."""
+    if result_path and status == JobStatus.COMPLETED:
+        return await asyncio.to_thread(_read_result_size, status, result_path)
+    return None
+
+
+def _apply_status_update(
+    job: Job,
+    status: JobStatus,
+    progress: Union[float, None],
+    error: Union[str, None],
+    result_path: Union[Path, None],
+    result_size_bytes: Union[int, None],
+) -> dict[str, Any]:
+    """
+    Apply a status update to a job in memory.
+
+    Returns:
+        The changed fields, for persistence
+    """
+    job.status = status
+    delta: dict[str, Any] = {"status": status}
+    if progress is not None:
+        job.progress = 0.0 if progress < 0.0 else 1.0 if progress > 1.0 else progress
+        delta["progress"] = job.progress
+    if error:
+        job.error = error
+        delta["error"] = error
+    if result_path:
+        job.result_path = result_path
+        delta["result_path"] = str(result_path)
+        if status == JobStatus.COMPLETED:
+            job.result_size_bytes = result_size_bytes
+            delta["result_size_bytes"] = result_size_bytes
+
+    if status == JobStatus.PROCESSING and not job.started_at:
+        job.started_at = time.time()
+        delta["started_at"] = job.started_at
+    elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
+        job.completed_at = time.time()
+        job.progress = 1.0
+        delta["completed_at"] = job.completed_at
+        delta["progress"] = 1.0
+    return delta
+
+
 class JobManager:
     """Manages separation jobs with persistent storage."""
 
@@ -89,34 +225,279 @@ class JobManager:
         """Initialize the job manager."""
         self._jobs: dict[str, Job] = {}
         self._cleanup_interval = 3600  # Clean up completed jobs after 1 hour
-        # Load existing jobs from disk
-        self._load_jobs_from_disk()
-        logger.info(f"JobManager initialized. Loaded {len(self._jobs)} jobs from disk.")
+        # Number of records in the journal; used to decide when to compact it
+        self._journal_records = 0
+        # Legacy per-job files to remove once their contents are in the journal
+        self._legacy_job_files: list[str] = []
+        # Coalesced records not yet written to the journal, keyed by job ID
+        self._pending: dict[str, dict[str, Any]] = {}
+        # Min-heap of (completed_at, job_id) so cleanup only visits expired jobs
+        self._completion_heap: list[tuple[float, str]] = []
+        # Single append-only journal for all job updates (opened on first use)
+        self._journal_fd: Union[int, None] = None
+        # Lock file serializing journal writes across API worker processes
+        self._journal_lock_fd: Union[int, None] = None
+        # Jobs are loaded from disk on first use so importing this module stays cheap
+        self._loaded = False
+        # When disabled, jobs live in memory only
+        self._persist = settings.persist_jobs
+        # Guards mutations of _jobs, _pending and _completion_heap (never held during I/O)
+        self._lock = threading.Lock()
+        # Serializes journal I/O: first load, flushes and compaction (re-entrant because
+        # a flush may trigger compaction)
+        self._io_lock = threading.RLock()
+        # Events for long-polling status requests, keyed by job ID; an update pops and
+        # sets the job's event so later waiters start on a fresh one
+        self._update_events: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+    def _ensure_loaded(self) -> None:
+        """Load persisted jobs and open the journal the first time jobs are accessed."""
+        if self._loaded:
+            return
+        with self._io_lock:
+            if self._loaded:
+                return
+            try:
+                if not self._persist:
+                    logger.info("JobManager initialized. Job persistence is disabled.")
+                    return
+
+                JOBS_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+                self._journal_lock_fd = os.open(
+                    JOURNAL_PATH.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o644
+                )
+                # Kept open for the life of the process: one write syscall per flush
+                self._reopen_journal()
+                atexit.register(self._close_journal)
+                with self._journal_locked():
+                    self._load_jobs_from_disk()
+                self._completion_heap = [
+                    (job.completed_at, job.job_id)
+                    for job in self._jobs.values()
+                    if job.completed_at
+                ]
+                heapq.heapify(self._completion_heap)
+                # Move legacy per-job files into the journal, then drop replayed history
+                self.flush()
+                self._compact_journal()
+                logger.info(f"JobManager initialized. Loaded {len(self._jobs)} jobs from disk.")
+            finally:
+                self._loaded = True
+
+    async def _ensure_loaded_async(self) -> None:
+        """_ensure_loaded, with the first load run in a worker thread off the event loop."""
+        if not self._loaded:
+            await asyncio.to_thread(self._ensure_loaded)
+
+    @staticmethod
+    def _job_to_record(job: Job) -> dict[str, Any]:
+        """Build the persisted record for a job."""
+        return {
+            "job_id": job.job_id,
+            "file_path": str(job.file_path),
+            "stems": job.stems,
+            "status": job.status,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error": job.error,
+            "result_path": str(job.result_path) if job.result_path else None,
+            "result_size_bytes": job.result_size_bytes,
+            "progress": job.progress,
+        }
 
-    def _get_job_file_path(self, job_id: str) -> Path:
-        """Get the file path for a job's persistent storage."""
-        return JOBS_STORAGE_DIR / f"{job_id}.json"
+    @staticmethod
+    def _job_from_record(job_data: dict[str, Any]) -> Job:
+        """Recreate a Job object from a persisted record."""
+        job = Job(
+            job_data["job_id"],
+            Path(job_data["file_path"]),
+            job_data["stems"],
+            created_at=job_data["created_at"],
+        )
+        job.status = JobStatus(job_data["status"])
+        job.started_at = job_data.get("started_at")
+        job.completed_at = job_data.get("completed_at")
+        job.error = job_data.get("error")
+        job.result_path = Path(job_data["result_path"]) if job_data.get("result_path") else None
+        job.result_size_bytes = job_data.get("result_size_bytes")
+        job.progress = job_data.get("progress", 0.0)
+        return job
 
-    def _save_job_to_disk(self, job: Job) -> None:
-        """Save a job to disk for persistence."""
+    @staticmethod
+    def _replay_journal(records: dict[str, dict[str, Any]]) -> int:
+        """
+        Fold the journal into one full record per job; the last record for a job wins.
+
+        Args:
+            records: Records to apply the journal on top of (updated in place)
+
+        Returns:
+            Number of journal lines read
+        """
+        line_count = 0
         try:
-            job_file = self._get_job_file_path(job.job_id)
-            job_data = {
-                "job_id": job.job_id,
-                "file_path": str(job.file_path),
-                "stems": job.stems,
-                "status": job.status.value,
-                "created_at": job.created_at,
-                "started_at": job.started_at,
-                "completed_at": job.completed_at,
-                "error": job.error,
-                "result_path": str(job.result_path) if job.result_path else None,
-                "progress": job.progress,
-            }
-            with open(job_file, "w") as f:
-                json.dump(job_data, f)
-        except Exception as e:
-            logger.warning(f"Failed to save job {job.job_id} to disk: {e}")
+            f = open(JOURNAL_PATH, "rb")
+        except FileNotFoundError:
+            return line_count
+        with f:
+            for line_count, line in enumerate(f, start=1):
+                try:
+                    record = orjson.loads(line)
+                    job_id = record["job_id"]
+                    if record.get("deleted"):
+                        records.pop(job_id, None)
+                    # Full records carry file_path; updates carry only changed fields
+                    elif "file_path" in record:
+                        records[job_id] = record
+                    elif job_id in records:
+                        records[job_id].update(record)
+                except Exception as e:
+                    # A torn final write after a crash is expected; skip it
+                    logger.warning(f"Failed to load job journal line {line_count}: {e}")
+        return line_count
+
+    def _queue_record(self, job_id: str, record: dict[str, Any]) -> None:
+        """
+        Queue a record for the next flush, merging it into any pending record for the job.
+
+        Must be called with ``self._lock`` held.
+        """
+        if not self._persist:
+            return
+        pending = self._pending.get(job_id)
+        if pending is None or record.get("deleted"):
+            self._pending[job_id] = record
+        else:
+            pending.update(record)
+
+    def _close_journal(self) -> None:
+        """Close the journal and lock file descriptors (registered with atexit)."""
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
+            self._journal_fd = None
+        if self._journal_lock_fd is not None:
+            os.close(self._journal_lock_fd)
+            self._journal_lock_fd = None
+
+    def _reopen_journal(self) -> None:
+        """Open the journal at JOURNAL_PATH, replacing any current descriptor."""
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
+        self._journal_fd = os.open(JOURNAL_PATH, JOURNAL_OPEN_FLAGS, 0o644)
+
+    @contextmanager
+    def _journal_locked(self) -> Iterator[None]:
+        """
+        Hold the cross-process journal lock.
+
+        Every API worker appends to the same journal, and compaction in one worker
+        replaces the file under the others. Appends check for that under this lock
+        and reopen the journal, so no record is written to the unlinked file.
+        """
+        if fcntl is None or self._journal_lock_fd is None:
+            yield
+            return
+        fcntl.flock(self._journal_lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._journal_lock_fd, fcntl.LOCK_UN)
+
+    def _reopen_journal_if_replaced(self) -> None:
+        """
+        Reopen the journal if another worker compacted it since it was opened.
+
+        Must be called with the journal lock held.
+        """
+        try:
+            replaced = os.fstat(self._journal_fd).st_ino != os.stat(JOURNAL_PATH).st_ino
+        except FileNotFoundError:
+            replaced = True
+        if replaced:
+            self._reopen_journal()
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        Write all pending job records to the journal in a single write.
+
+        Args:
+            sync: Also force the data to stable storage (used for terminal transitions)
+        """
+        if not self._pending:
+            return
+
+        with self._io_lock:
+            with self._lock:
+                records, self._pending = self._pending, {}
+            if not records:
+                return
+
+            try:
+                data = memoryview(b"".join(orjson.dumps(r) + b"\n" for r in records.values()))
+                with self._journal_locked():
+                    self._reopen_journal_if_replaced()
+                    while data:
+                        data = data[os.write(self._journal_fd, data) :]
+                    if sync:
+                        _datasync(self._journal_fd)
+                self._journal_records += len(records)
+            except Exception as e:
+                logger.warning(f"Failed to write {len(records)} job records to disk: {e}")
+                return
+
+            if self._journal_records > max(JOURNAL_COMPACT_THRESHOLD, 2 * len(self._jobs)):
+                self._compact_journal()
+
+    async def run_flusher(self) -> None:
+        """Periodically flush coalesced job updates to the journal."""
+        while True:
+            await asyncio.sleep(JOURNAL_FLUSH_INTERVAL)
+            # The write (and any compaction it triggers) runs off the event loop
+            if self._pending:
+                await asyncio.to_thread(self.flush)
+
+    def _save_job_to_disk(self, job: Job) -> None:
+        """Save a job to disk for persistence (written on the next flush)."""
+        self._queue_record(job.job_id, self._job_to_record(job))
+
+    def _save_job_delta_to_disk(self, job_id: str, delta: dict[str, Any]) -> None:
+        """Persist only the fields of a job that changed (written on the next flush)."""
+        self._queue_record(job_id, {"job_id": job_id, **delta})
+
+    def _compact_journal(self) -> None:
+        """
+        Rewrite the journal so it holds exactly one record per live job.
+
+        Other API workers append to the same journal, so the snapshot is rebuilt from
+        the file itself rather than from this process's jobs. Records still pending
+        here are written to the new journal by the next flush.
+        """
+        with self._io_lock:
+            try:
+                with self._journal_locked():
+                    records: dict[str, dict[str, Any]] = {}
+                    self._replay_journal(records)
+                    snapshot = b"".join(orjson.dumps(r) + b"\n" for r in records.values())
+
+                    tmp_path = JOURNAL_PATH.with_suffix(".jsonl.tmp")
+                    with open(tmp_path, "wb") as f:
+                        f.write(snapshot)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, JOURNAL_PATH)
+                    self._reopen_journal()
+                self._journal_records = len(records)
+
+                # Legacy per-job files are now covered by the journal
+                for job_file in self._legacy_job_files:
+                    try:
+                        os.remove(job_file)
+                    except FileNotFoundError:
+                        pass
+                self._legacy_job_files.clear()
+            except Exception as e:
+                logger.warning(f"Failed to compact job journal: {e}")
 
     def _load_jobs_from_disk(self) -> None:
         """Load all jobs from disk on startup."""
@@ -124,32 +505,48 @@ class JobManager:
             if not JOBS_STORAGE_DIR.exists():
                 return
 
-            for job_file in JOBS_STORAGE_DIR.glob("*.json"):
+            records: dict[str, dict[str, Any]] = {}
+            legacy_job_ids = []
+            # Legacy per-job files written before the journal existed. Reading them is
+            # dominated by open/read latency, so fan out and merge on this thread.
+            with os.scandir(JOBS_STORAGE_DIR) as entries:
+                job_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+                ]
+            if job_files:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(job_files))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for job_file, job_data in zip(
+                        job_files, executor.map(_read_job_file, job_files), strict=True
+                    ):
+                        if job_data is None:
+                            continue
+                        try:
+                            job = self._job_from_record(job_data)
+                            records[job.job_id] = job_data
+                            legacy_job_ids.append(job.job_id)
+                            self._legacy_job_files.append(job_file)
+                        except Exception as e:
+                            logger.warning(f"Failed to load job from {job_file}: {e}")
+
+            self._journal_records = self._replay_journal(records)
+            for job_id, job_data in records.items():
                 try:
-                    with open(job_file, "r") as f:
-                        job_data = json.load(f)
-
-                    # Recreate Job object
-                    job = Job(
-                        job_data["job_id"],
-                        Path(job_data["file_path"]),
-                        job_data["stems"],
-                    )
-                    job.status = JobStatus(job_data["status"])
-                    job.created_at = job_data["created_at"]
-                    job.started_at = job_data.get("started_at")
-                    job.completed_at = job_data.get("completed_at")
-                    job.error = job_data.get("error")
-                    job.result_path = Path(job_data["result_path"]) if job_data.get("result_path") else None
-                    job.progress = job_data.get("progress", 0.0)
-
-                    self._jobs[job.job_id] = job
+                    self._jobs[job_id] = self._job_from_record(job_data)
                 except Exception as e:
-                    logger.warning(f"Failed to load job from {job_file}: {e}")
+                    logger.warning(f"Failed to load job {job_id} from the journal: {e}")
+
+            # Legacy jobs are written to the journal before their files are removed
+            with self._lock:
+                for job_id in legacy_job_ids:
+                    if job_id in self._jobs:
+                        self._save_job_to_disk(self._jobs[job_id])
         except Exception as e:
             logger.warning(f"Failed to load jobs from disk: {e}")
 
-    def create_job(self, file_path: Path, stems: int) -> Job:
+    async def create_job(self, file_path: Path, stems: int) -> Job:
         """
         Create a new separation job.
 
@@ -160,14 +557,16 @@ class JobManager:
         Returns:
             Created job instance
         """
-        job_id = str(uuid.uuid4())
+        await self._ensure_loaded_async()
+        job_id = secrets.token_hex(16)
         job = Job(job_id, file_path, stems)
-        self._jobs[job_id] = job
-        self._save_job_to_disk(job)  # Persist immediately
+        with self._lock:
+            self._jobs[job_id] = job
+            self._save_job_to_disk(job)  # Persisted on the next flush
         logger.info(f"Created job {job_id} for file {file_path.name} with {stems} stems")
         return job
 
-    def get_job(self, job_id: str) -> Union[Job, None]:
+    async def get_job(self, job_id: str) -> Union[Job, None]:
         """
         Get a job by ID.
 
@@ -177,9 +576,10 @@ class JobManager:
         Returns:
             Job instance or None if not found
         """
+        await self._ensure_loaded_async()
         return self._jobs.get(job_id)
 
-    def update_job_status(
+    async def update_job_status(
         self,
         job_id: str,
         status: JobStatus,
@@ -200,30 +600,69 @@ class JobManager:
         Returns:
             True if job was updated, False if not found
         """
-        job = self._jobs.get(job_id)
-        if not job:
+        await self._ensure_loaded_async()
+        if job_id not in self._jobs:
             return False
 
-        job.status = status
-        if progress is not None:
-            job.progress = max(0.0, min(1.0, progress))
-        if error:
-            job.error = error
-        if result_path:
-            job.result_path = result_path
+        # Done before taking the lock to keep I/O out of it
+        result_size_bytes = await _read_result_size_async(status, result_path)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return False
+
+            delta = _apply_status_update(
+                job, status, progress, error, result_path, result_size_bytes
+            )
+            if "completed_at" in delta:
+                heapq.heappush(self._completion_heap, (job.completed_at, job_id))
+
+            # Persist only the changed fields
+            self._save_job_delta_to_disk(job_id, delta)
+            waiter = self._update_events.pop(job_id, None)
 
-        if status == JobStatus.PROCESSING and not job.started_at:
-            job.started_at = time.time()
-        elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
-            job.completed_at = time.time()
-            job.progress = 1.0
+        if waiter is not None:
+            loop, event = waiter
+            # Updates can come from worker threads; the event belongs to the loop
+            loop.call_soon_threadsafe(event.set)
 
-        # Persist job state to disk
-        self._save_job_to_disk(job)
+        # Terminal states are written and synced immediately, from a worker thread so
+        # the write and fdatasync never stall the event loop
+        if status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            await asyncio.to_thread(self.flush, True)
 
-        logger.info(f"Job {job_id} status updated to {status.value}")
+        logger.info(f"Job {job_id} status updated to {status}")
         return True
 
+    async def wait_for_update(
+        self, job_id: str, status: JobStatus, progress: float, timeout: float
+    ) -> None:
+        """
+        Wait until a job changes from the state the caller last saw, or the timeout ends.
+
+        Args:
+            job_id: Job identifier
+            status: Status the caller last saw
+            progress: Progress the caller last saw
+            timeout: Maximum seconds to wait
+        """
+        await self._ensure_loaded_async()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            # Edge case: Job changed (or disappeared) before we started waiting
+            if job is None or job.status != status or job.progress != progress:
+                return
+            waiter = self._update_events.get(job_id)
+            if waiter is None:
+                waiter = (asyncio.get_running_loop(), asyncio.Event())
+                self._update_events[job_id] = waiter
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     def cleanup_old_jobs(self) -> int:
         """
         Clean up completed/failed jobs older than cleanup interval.
@@ -231,33 +670,239 @@ class JobManager:
         Returns:
             Number of jobs cleaned up
         """
-        current_time = time.time()
+        self._ensure_loaded()
+        cutoff = time.time() - self._cleanup_interval
+        heap = self._completion_heap
         jobs_to_remove = []
 
-        for job_id, job in self._jobs.items():
-            if job.completed_at and (current_time - job.completed_at) > self._cleanup_interval:
+        with self._lock:
+            # Only the expired prefix of the heap is visited
+            while heap and heap[0][0] < cutoff:
+                completed_at, job_id = heapq.heappop(heap)
+                job = self._jobs.get(job_id)
+                # Skip stale entries (job already removed or completed again later)
+                if job is None or job.completed_at != completed_at:
+                    continue
                 jobs_to_remove.append(job_id)
 
-        for job_id in jobs_to_remove:
-            # Remove from memory
-            del self._jobs[job_id]
-            # Remove from disk
-            job_file = self._get_job_file_path(job_id)
-            try:
-                if job_file.exists():
-                    job_file.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to remove job file {job_file}: {e}")
+            for job_id in jobs_to_remove:
+                # Remove from memory
+                del self._jobs[job_id]
+                self._update_events.pop(job_id, None)
+                # Record the removal in the journal
+                self._queue_record(job_id, {"job_id": job_id, "deleted": True})
 
         if jobs_to_remove:
+            self.flush()
             logger.info(f"Cleaned up {len(jobs_to_remove)} old jobs")
         return len(jobs_to_remove)
 
-    def get_all_jobs(self) -> list[Job]:
+    async def get_all_jobs(self) -> list[Job]:
         """Get all jobs (for debugging/monitoring)."""
-        return list(self._jobs.values())
+        await self._ensure_loaded_async()
+        with self._lock:
+            return list(self._jobs.values())
+
+
+class RedisJobManager:
+    """
+    Manages separation jobs in Redis so several API processes share job state.
+
+    Each job is a hash at ``job:{job_id}`` with a TTL, so expired jobs disappear
+    without a cleanup pass. Uses the asyncio client, so no Redis round-trip blocks
+    the event loop. Requires the optional ``redis`` package.
+    """
+
+    _INT_FIELDS = ("stems", "result_size_bytes")
+    _FLOAT_FIELDS = ("created_at", "started_at", "completed_at", "progress")
+
+    def __init__(self, redis_url: str):
+        """
+        Initialize the job manager.
+
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0)
+        """
+        import redis.asyncio as redis
+
+        # Connections are opened lazily, on the event loop that first uses them
+        self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._ttl = JOB_TTL_SECONDS
+        logger.info("RedisJobManager initialized.")
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        """Redis key holding a job's hash."""
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _updates_channel(job_id: str) -> str:
+        """Pub/sub channel announcing a job's status updates."""
+        return f"job-updates:{job_id}"
+
+    @staticmethod
+    def _queue_write(pipe: Any, key: str, fields: dict[str, Any], ttl: int) -> None:
+        """Queue changed fields (Redis hashes cannot hold None) and a TTL refresh."""
+        mapping = {k: v for k, v in fields.items() if v is not None}
+        if mapping:
+            pipe.hset(key, mapping=mapping)
+        pipe.expire(key, ttl)
+
+    def _job_from_hash(self, data: dict[str, str]) -> Job:
+        """Recreate a Job object from its Redis hash."""
+        record: dict[str, Any] = dict(data)
+        for field in self._INT_FIELDS:
+            if field in record:
+                record[field] = int(record[field])
+        for field in self._FLOAT_FIELDS:
+            if field in record:
+                record[field] = float(record[field])
+        return JobManager._job_from_record(record)
+
+    async def create_job(self, file_path: Path, stems: int) -> Job:
+        """
+        Create a new separation job.
+
+        Args:
+            file_path: Path to the uploaded audio file
+            stems: Number of stems to separate into
+
+        Returns:
+            Created job instance
+        """
+        job_id = secrets.token_hex(16)
+        job = Job(job_id, file_path, stems)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._queue_write(pipe, self._key(job_id), JobManager._job_to_record(job), self._ttl)
+            await pipe.execute()
+        logger.info(f"Created job {job_id} for file {file_path.name} with {stems} stems")
+        return job
+
+    async def get_job(self, job_id: str) -> Union[Job, None]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job instance or None if not found
+        """
+        data = await self._redis.hgetall(self._key(job_id))
+        return self._job_from_hash(data) if data else None
+
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: Union[float, None] = None,
+        error: Union[str, None] = None,
+        result_path: Union[Path, None] = None,
+    ) -> bool:
+        """
+        Update job status.
+
+        The read of the current job and the write of the changed fields run as one
+        WATCH/MULTI transaction, retried if another process updates the job between
+        them.
+
+        Args:
+            job_id: Job identifier
+            status: New status
+            progress: Progress (0.0 to 1.0)
+            error: Error message if failed
+            result_path: Path to result file if completed
+
+        Returns:
+            True if job was updated, False if not found
+        """
+        from redis.exceptions import WatchError
+
+        result_size_bytes = await _read_result_size_async(status, result_path)
+        key = self._key(job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    data = await pipe.hgetall(key)
+                    if not data:
+                        return False
+                    job = self._job_from_hash(data)
+                    delta = _apply_status_update(
+                        job, status, progress, error, result_path, result_size_bytes
+                    )
+                    pipe.multi()
+                    self._queue_write(pipe, key, delta, self._ttl)
+                    # JobStatus is a str, so it is published as its plain value
+                    pipe.publish(self._updates_channel(job_id), status)
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    # Edge case: Concurrent update; re-read the job and try again
+                    continue
+
+        logger.info(f"Job {job_id} status updated to {status}")
+        return True
+
+    async def wait_for_update(
+        self, job_id: str, status: JobStatus, progress: float, timeout: float
+    ) -> None:
+        """
+        Wait until a job changes from the state the caller last saw, or the timeout ends.
+
+        Updates may come from another API process, so this listens on the job's pub/sub
+        channel.
+
+        Args:
+            job_id: Job identifier
+            status: Status the caller last saw
+            progress: Progress the caller last saw
+            timeout: Maximum seconds to wait
+        """
+        deadline = time.monotonic() + timeout
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            # Subscribe before re-reading the job so no update can slip in between
+            await pubsub.subscribe(self._updates_channel(job_id))
+            job = await self.get_job(job_id)
+            if job is None or job.status != status or job.progress != progress:
+                return
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None:
+                    return
+        finally:
+            await pubsub.aclose()
+
+    def cleanup_old_jobs(self) -> int:
+        """Jobs expire through their Redis TTL, so there is nothing to clean up."""
+        return 0
+
+    async def get_all_jobs(self) -> list[Job]:
+        """Get all jobs (for debugging/monitoring)."""
+        jobs = []
+        async for key in self._redis.scan_iter(match="job:*"):
+            data = await self._redis.hgetall(key)
+            if data:
+                jobs.append(self._job_from_hash(data))
+        return jobs
+
+    def flush(self, sync: bool = False) -> None:
+        """Writes go straight to Redis; nothing is buffered."""
+
+    async def run_flusher(self) -> None:
+        """Writes go straight to Redis; no background flushing is needed."""
+
+
+def _create_job_manager() -> Union[JobManager, RedisJobManager]:
+    """Use Redis for shared job state when configured, otherwise the local journal."""
+    if settings.redis_url:
+        return RedisJobManager(settings.redis_url)
+    return JobManager()
 
 
 # Global job manager instance
-job_manager = JobManager()
+job_manager = _create_job_manager()
 
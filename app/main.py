@@ -1,22 +1,41 @@
 import asyncio
+import heapq
 import logging
+import multiprocessing
 import os
+import random
+import re
+import secrets
+import stat
+import threading
 import time
-import uuid
+from collections import deque
+from collections.abc import Coroutine
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Union
 
 from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Request, UploadFile
 from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from app.config import settings
 from app.jobs import JobStatus, job_manager
-from app.service import SpleeterService
+from app.service import (
+    DISK_CHECK_TTL_SECONDS,
+    SeparationError,
+    detect_cpu_quota,
+    detect_gpu_count,
+    get_spleeter_service,
+    init_separation_worker,
+    refresh_free_space,
+    run_separation_batch_in_worker,
+    warm_separation_worker,
+)
 
 # Configure structured logging
 logging.basicConfig(
@@ -25,8 +44,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Bound once; read twice per request by the timing middleware
+_perf_counter = time.perf_counter
+# Bound once; called on every result download
+_os_stat = os.stat
+
+# Settings read by request handlers, resolved once at import
+_UPLOAD_DIR = settings.upload_dir
+_OUTPUT_DIR = settings.output_dir
+_TRUST_FORWARDED_FOR = settings.trust_forwarded_for
+_FORWARDED_FOR_HOPS = max(settings.forwarded_for_hops, 1)
+_ROOT_INFO = {
+    "message": f"{settings.app_title} is running",
+    "version": settings.app_version,
+    "docs": "/docs",
+    "endpoint": "POST /separate",
+    "description": "Upload an audio file to separate into stems",
+}
+# Fields of /health that never change while the process runs
+_HEALTH_STATIC = {
+    "service": settings.app_title,
+    "version": settings.app_version,
+    "max_file_size_mb": settings.max_file_size_mb,
+    "allowed_extensions": list(settings.allowed_extensions_sorted),
+}
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Identify the client for rate limiting, memoized on the request state.
+
+    Behind a reverse proxy (TRUST_FORWARDED_FOR=true) the client is the
+    X-Forwarded-For entry added by the outermost trusted proxy, FORWARDED_FOR_HOPS
+    entries from the right; otherwise it is the connection's remote address.
+    Entries further left are supplied by the client and can be forged.
+    """
+    key = getattr(request.state, "rate_limit_key", None)
+    if key is not None:
+        return key
+
+    forwarded_for = None
+    if _TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        # Only the rightmost entries are appended by our proxies
+        entries = forwarded_for.rsplit(",", _FORWARDED_FOR_HOPS)
+        # Edge case: Fewer entries than hops; every entry then came from a proxy
+        key = entries[max(len(entries) - _FORWARDED_FOR_HOPS, 0)].strip()
+    else:
+        key = get_remote_address(request)
+    request.state.rate_limit_key = key
+    return key
+
+
+# Initialize rate limiter; counters live in Redis when configured so they are shared
+# by every API process
+limiter = Limiter(key_func=rate_limit_key, storage_uri=settings.redis_url or "memory://")
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -35,6 +108,7 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter to app state
@@ -51,100 +125,288 @@ app.add_middleware(
 )
 
 # Initialize service
-spleeter_service = SpleeterService()
+spleeter_service = get_spleeter_service()
+app.state.spleeter_service = spleeter_service
 
 
-async def process_separation_job(job_id: str, file_path: Path, stems: int) -> None:
-    """
-    Process a separation job in the background.
+class ZipFileResponse(FileResponse):
+    """FileResponse for result archives, sent in 1 MiB chunks instead of 64 KiB."""
 
-    Args:
-        job_id: Job identifier
-        file_path: Path to the audio file
-        stems: Number of stems to separate into
-    """
-    logger.info(f"[{job_id}] Starting background separation processing")
-    job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.05)
+    # Stems archives run to hundreds of MB; larger reads cut per-chunk overhead
+    chunk_size = 1 << 20
 
-    cleanup_paths = [file_path]
-    zip_path = settings.output_dir / f"{job_id}.zip"
 
-    try:
-        # Step 1: Validate and prepare (5-10%)
-        logger.info(f"[{job_id}] Step 1/4: Validating file and preparing separation")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.1)
+# Request IDs only need to be unique, not unpredictable: draw them from a PRNG seeded
+# once from the OS instead of paying for a urandom read on every request
+_request_id_rng = random.Random(secrets.token_bytes(16))
 
-        # Step 2: Load/initialize TensorFlow model (10-20%)
-        # This happens inside run_separation, but we update progress before
-        logger.info(f"[{job_id}] Step 2/4: Loading TensorFlow model (this may take 10-30 seconds)")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.15)
 
-        # Step 3: Run Spleeter separation (20-70%)
-        # This is the longest step - separation can take 30-120 seconds
-        logger.info(f"[{job_id}] Step 3/4: Running audio separation (this may take 30-120 seconds)")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.2)
+def _new_request_id() -> str:
+    """Return a random 128-bit request ID as 32 hex characters."""
+    return f"{_request_id_rng.getrandbits(128):032x}"
 
-        # Run separation in thread pool with progress callback
-        output_folder_path = await run_in_threadpool(
-            spleeter_service.run_separation, file_path, stems
-        )
-        cleanup_paths.append(output_folder_path)
 
-        # Separation completed, update progress
-        logger.info(f"[{job_id}] Separation completed, preparing output")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.7)
+# Health checks are probed far more often than disk state changes; reuse the last
+# result for this long instead of re-running os.access/os.statvfs on every probe
+HEALTH_CACHE_TTL_SECONDS = 5.0
+_health_cache: tuple[float, dict[str, Any]] | None = None
+_health_cache_lock = threading.Lock()
 
-        # Step 4: Create zip file (70-95%)
-        logger.info(f"[{job_id}] Step 4/4: Creating ZIP archive")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.75)
-        await run_in_threadpool(spleeter_service.create_zip, output_folder_path, zip_path)
-        cleanup_paths.append(zip_path)
+# Characters stripped from download filenames (anything outside ASCII letters,
+# digits and "._-"), so they are safe inside the Content-Disposition header
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
 
-        # Verify zip file
-        logger.info(f"[{job_id}] Verifying output file")
-        job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.9)
-        if not zip_path.exists() or zip_path.stat().st_size == 0:
-            raise Exception("Zip file was not created or is empty")
+# Upper bound for /jobs/{job_id}/status?wait=, kept below common proxy idle timeouts
+LONG_POLL_MAX_SECONDS = 25.0
 
-        # Mark job as completed
-        job_manager.update_job_status(
-            job_id, JobStatus.COMPLETED, progress=1.0, result_path=zip_path
-        )
-        logger.info(f"[{job_id}] Separation completed successfully: {zip_path}")
+# How long shutdown waits for running separation jobs before cancelling them
+JOB_SHUTDOWN_GRACE_SECONDS = 30.0
 
-        # Schedule cleanup after 1 hour (give time for download)
-        await asyncio.sleep(3600)
-        spleeter_service.cleanup_files(cleanup_paths)
-        logger.info(f"[{job_id}] Cleaned up temporary files")
+# Models loaded by each separation worker when it starts
+PREWARM_STEMS = (2, 4)
 
-    except Exception as e:
-        logger.error(f"[{job_id}] Separation failed: {e}", exc_info=True)
-        job_manager.update_job_status(
-            job_id, JobStatus.FAILED, progress=1.0, error=str(e)
-        )
-        # Cleanup on failure
-        spleeter_service.cleanup_files(cleanup_paths)
+# How long job results are kept for download before their files are removed
+RESULT_RETENTION_SECONDS = 3600
 
+# Pending file cleanups as (due_time, job_id, paths), served by a single reaper task
+_cleanup_heap: list[tuple[float, str, list[Path]]] = []
+# Set when a cleanup due earlier than the current head is scheduled
+_cleanup_wakeup = asyncio.Event()
+
+
+def schedule_cleanup(job_id: str, paths: list[Path], delay: float) -> None:
+    """
+    Schedule files to be removed after a delay.
+
+    Args:
+        job_id: Job the files belong to (for logging)
+        paths: Files and directories to remove
+        delay: Seconds from now until removal
+    """
+    entry = (time.time() + delay, job_id, paths)
+    heapq.heappush(_cleanup_heap, entry)
+    if _cleanup_heap[0] is entry:
+        _cleanup_wakeup.set()
 
-@app.on_event("startup")
-async def startup_event():
-    """Pre-warm TensorFlow models on startup and start background tasks."""
-    logger.info("Starting application startup tasks...")
 
-    # Recover stuck jobs (jobs in processing state that were interrupted by restart)
+async def disk_space_poller() -> None:
+    """Keep the upload disk-space check fresh so uploads do not call statvfs inline."""
+    while True:
+        try:
+            await run_in_threadpool(refresh_free_space, _UPLOAD_DIR)
+        except AttributeError:
+            # Windows has no statvfs; uploads skip the check there anyway
+            return
+        except OSError as e:
+            logger.warning(f"Could not check disk space: {e}")
+        # Refresh before the cached value expires
+        await asyncio.sleep(DISK_CHECK_TTL_SECONDS / 2)
+
+
+async def cleanup_reaper() -> None:
+    """Remove scheduled files as they come due, sleeping until the next deadline."""
+    while True:
+        now = time.time()
+        while _cleanup_heap and _cleanup_heap[0][0] <= now:
+            _, job_id, paths = heapq.heappop(_cleanup_heap)
+            await run_in_threadpool(spleeter_service.cleanup_files, paths)
+            logger.info(f"[{job_id}] Cleaned up temporary files")
+
+        timeout = _cleanup_heap[0][0] - now if _cleanup_heap else None
+        _cleanup_wakeup.clear()
+        try:
+            await asyncio.wait_for(_cleanup_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class SeparationBatcher:
+    """
+    Hands queued separations to the worker pool, batching them while workers are busy.
+
+    A batch is dispatched as soon as a worker is free, so an idle server runs every
+    request on its own; under load, requests that queued up behind busy workers and
+    share a stem count go to one worker call and reuse its loaded model.
+    """
+
+    def __init__(self, pool: Executor, max_workers: int, max_batch_size: int) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            pool: Executor running the separation workers
+            max_workers: Number of batches allowed in flight at once
+            max_batch_size: Maximum number of files per batch
+        """
+        self._pool = pool
+        self._max_batch_size = max_batch_size
+        self._pending: deque[tuple[str, int, asyncio.Future]] = deque()
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_workers)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, file_path: Path, stems: int) -> Path:
+        """
+        Queue a separation and wait for its result.
+
+        Args:
+            file_path: Path to the audio file to separate
+            stems: Number of stems (2, 4, or 5)
+
+        Returns:
+            Path to the output directory containing separated stems
+
+        Raises:
+            HTTPException: If separation fails
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((str(file_path), stems, future))
+        self._wakeup.set()
+        return Path(await future)
+
+    async def run(self) -> None:
+        """Dispatch pending separations whenever a worker slot is free."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                await self._slots.acquire()
+                stems, batch = self._take_batch()
+                if not batch:
+                    self._slots.release()
+                    continue
+                task = asyncio.create_task(self._dispatch(stems, batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def _take_batch(self) -> tuple[int, list[tuple[str, asyncio.Future]]]:
+        """Pop the oldest pending separation plus queued ones with the same stem count."""
+        stems = 0
+        batch: list[tuple[str, asyncio.Future]] = []
+        remaining: deque[tuple[str, int, asyncio.Future]] = deque()
+        for item in self._pending:
+            file_path, item_stems, future = item
+            # Edge case: Caller went away (e.g. client disconnected) before dispatch
+            if future.done():
+                continue
+            if not batch:
+                stems = item_stems
+            if item_stems == stems and len(batch) < self._max_batch_size:
+                batch.append((file_path, future))
+            else:
+                remaining.append(item)
+        self._pending = remaining
+        return stems, batch
+
+    async def _dispatch(self, stems: int, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Run one batch in the worker pool and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._pool, run_separation_batch_in_worker, [path for path, _ in batch], stems
+            )
+            # Edge case: A result list of the wrong length would leave futures unresolved
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Separation worker returned {len(results)} results for {len(batch)} files"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if isinstance(result, SeparationError):
+                    future.set_exception(
+                        HTTPException(status_code=result.status_code, detail=result.detail)
+                    )
+                else:
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+
+class JobScheduler:
+    """
+    Runs background jobs as supervised tasks with a bound on how many run at once.
+
+    Tasks are kept referenced until they finish, unexpected failures are logged, and
+    close() lets running jobs finish (up to a deadline) before the process exits.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            limit: Maximum number of jobs running at once; later jobs wait their turn
+        """
+        self._slots = asyncio.Semaphore(limit)
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+
+    def spawn(self, coro: Coroutine[Any, Any, None], name: str) -> None:
+        """
+        Start a job.
+
+        Args:
+            coro: Job coroutine
+            name: Name used in logs
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("Job scheduler is closed")
+        task = asyncio.create_task(self._run(coro), name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    async def _run(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a job once a slot is free."""
+        async with self._slots:
+            await coro
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Drop the finished task and log failures that escaped the job."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background job {task.get_name()} failed", exc_info=task.exception())
+
+    async def close(self, timeout: float) -> None:
+        """
+        Stop accepting jobs and wait for running ones, cancelling any left at the deadline.
+
+        Args:
+            timeout: Seconds to wait for running jobs
+        """
+        self._closed = True
+        if not self._tasks:
+            return
+        logger.info(f"Waiting up to {timeout:.0f}s for {len(self._tasks)} background job(s)")
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            logger.warning(f"Cancelled {len(pending)} background job(s) at shutdown")
+
+
+async def recover_stuck_jobs() -> None:
+    """Fail jobs left in the processing state by an interrupted restart."""
     try:
         logger.info("Checking for stuck jobs...")
         current_time = time.time()
         stuck_threshold = 300  # 5 minutes - if processing for more than 5 min, likely stuck
 
-        all_jobs = job_manager.get_all_jobs()
+        all_jobs = await job_manager.get_all_jobs()
         logger.info(f"Found {len(all_jobs)} total jobs to check")
         stuck_jobs = []
         for job in all_jobs:
             if job.status == JobStatus.PROCESSING:
                 elapsed = current_time - (job.started_at or job.created_at)
                 logger.info(
-                    f"Checking job {job.job_id}: status={job.status.value}, "
+                    f"Checking job {job.job_id}: status={job.status}, "
                     f"elapsed={elapsed:.0f}s, threshold={stuck_threshold}s"
                 )
                 if elapsed > stuck_threshold:
@@ -153,7 +415,7 @@ async def startup_event():
                         f"Found stuck job {job.job_id} (processing for {elapsed:.0f}s). "
                         f"Marking as failed."
                     )
-                    job_manager.update_job_status(
+                    await job_manager.update_job_status(
                         job.job_id,
                         JobStatus.FAILED,
                         error="Job was interrupted by application restart. Please retry.",
@@ -166,53 +428,196 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error recovering stuck jobs: {e}", exc_info=True)
 
+
+async def run_separation_in_pool(file_path: Path, stems: int) -> Path:
+    """
+    Run Spleeter separation in the separation process pool.
+
+    Args:
+        file_path: Path to the audio file to separate
+        stems: Number of stems (2, 4, or 5)
+
+    Returns:
+        Path to the output directory containing separated stems
+
+    Raises:
+        HTTPException: If separation fails
+    """
+    return await app.state.separation_batcher.submit(file_path, stems)
+
+
+async def process_separation_job(
+    job_id: str, file_path: Path, stems: int, content_digest: str | None = None
+) -> None:
+    """
+    Process a separation job in the background.
+
+    Args:
+        job_id: Job identifier
+        file_path: Path to the audio file
+        stems: Number of stems to separate into
+        content_digest: Content digest of the upload; the result is cached under it
+    """
+    logger.info(f"[{job_id}] Starting background separation processing")
+    await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.05)
+
+    cleanup_paths = [file_path]
+
+    try:
+        # Step 1: Validate and prepare (5-10%)
+        logger.info(f"[{job_id}] Step 1/4: Validating file and preparing separation")
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.1)
+
+        # Step 2: Load/initialize TensorFlow model (10-20%)
+        # This happens in the separation worker, but we update progress before
+        logger.info(f"[{job_id}] Step 2/4: Loading TensorFlow model (this may take 10-30 seconds)")
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.15)
+
+        # Step 3: Run Spleeter separation (20-70%)
+        # This is the longest step - separation can take 30-120 seconds
+        logger.info(f"[{job_id}] Step 3/4: Running audio separation (this may take 30-120 seconds)")
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.2)
+
+        # Run separation in a worker process (CPU bound, keeps the event loop free)
+        output_folder_path = await run_separation_in_pool(file_path, stems)
+        cleanup_paths.append(output_folder_path)
+
+        # Separation completed, update progress
+        logger.info(f"[{job_id}] Separation completed, preparing output")
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.7)
+
+        # Step 4: Verify the stems (70-95%). The zip is streamed from them when the
+        # result is downloaded, so no archive is written to disk
+        logger.info(f"[{job_id}] Step 4/4: Verifying output files")
+        await job_manager.update_job_status(job_id, JobStatus.PROCESSING, progress=0.9)
+        # Raises for missing, empty or oversized output
+        await run_in_threadpool(spleeter_service.validate_output, output_folder_path)
+
+        # Mark job as completed
+        await job_manager.update_job_status(
+            job_id, JobStatus.COMPLETED, progress=1.0, result_path=output_folder_path
+        )
+        logger.info(f"[{job_id}] Separation completed successfully: {output_folder_path}")
+
+        # Keep the result for repeat uploads of the same audio (hard links, no copy)
+        await run_in_threadpool(
+            spleeter_service.cache_result, content_digest, stems, output_folder_path
+        )
+
+        # Schedule cleanup after 1 hour (give time for download)
+        schedule_cleanup(job_id, cleanup_paths, RESULT_RETENTION_SECONDS)
+
+    except Exception as e:
+        logger.error(f"[{job_id}] Separation failed: {e}", exc_info=True)
+        await job_manager.update_job_status(
+            job_id, JobStatus.FAILED, progress=1.0, error=str(e)
+        )
+        # Cleanup on failure
+        await run_in_threadpool(spleeter_service.cleanup_files, cleanup_paths)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Recover stuck jobs, start the separation worker pool and background tasks."""
+    logger.info("Starting application startup tasks...")
+
+    # Recover stuck jobs in the background; loading the persisted jobs can take a while
+    asyncio.create_task(recover_stuck_jobs())
+
     # Start background cleanup task first (non-blocking)
     async def periodic_cleanup():
         """Periodically clean up old jobs."""
         while True:
             await asyncio.sleep(3600)  # Run every hour
-            job_manager.cleanup_old_jobs()
+            # Expiry flushes deletion records to the journal, so keep it off the loop
+            await asyncio.to_thread(job_manager.cleanup_old_jobs)
 
     asyncio.create_task(periodic_cleanup())
 
-    # Pre-warm TensorFlow models in background (non-blocking)
-    async def pre_warm_models():
-        """Pre-warm TensorFlow models in background."""
-        try:
-            logger.info("Pre-warming TensorFlow models...")
-            for stems in [2, 4]:
-                logger.info(f"Pre-warming {stems}-stem model...")
-                # Pre-initialize separator to load model into memory (run in thread pool)
-                await run_in_threadpool(spleeter_service._get_separator, stems)
-                logger.info(f"{stems}-stem model ready")
-            logger.info("All models pre-warmed successfully")
-        except Exception as e:
-            logger.warning(f"Model pre-warming failed (non-critical): {e}")
+    # Remove job result files once their retention period has passed
+    asyncio.create_task(cleanup_reaper())
+
+    # Refresh free disk space out of band for the upload path
+    asyncio.create_task(disk_space_poller())
+
+    # Flush coalesced job status updates to disk in the background
+    asyncio.create_task(job_manager.run_flusher())
+
+    # Separation runs in worker processes so TensorFlow never competes with the
+    # event loop for the GIL. "spawn" avoids forking a process that may already
+    # hold TensorFlow thread pools.
+    cpu_quota = detect_cpu_quota()
+    # May run nvidia-smi, so it is kept off the event loop
+    gpu_count = await asyncio.to_thread(detect_gpu_count)
+    if gpu_count:
+        # One worker per GPU; each worker only sees its own device
+        workers = gpu_count
+    else:
+        workers = max(1, min(settings.max_concurrent_separations, cpu_quota // 2))
+    # Split the container's CPU quota between workers so TensorFlow is not throttled;
+    # each worker applies its thread settings in its initializer
+    intra_op_threads = max(1, cpu_quota // workers)
+    app.state.tf_threads = {"intra_op": intra_op_threads, "inter_op": 1}
+    mp_context = multiprocessing.get_context("spawn")
+    # Each worker loads its own models in its initializer, so the API process never
+    # holds TensorFlow graphs; the counter hands workers round-robin CPU blocks
+    app.state.spleeter_pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=init_separation_worker,
+        initargs=(PREWARM_STEMS, intra_op_threads, mp_context.Value("i", 0), gpu_count),
+    )
+    logger.info(
+        f"Started separation process pool with {workers} worker(s), "
+        f"{intra_op_threads} TensorFlow intra-op thread(s) each (CPU quota: {cpu_quota}, "
+        f"GPUs: {gpu_count})"
+    )
+    # The pool only spawns workers as tasks arrive; start them all now so model loading
+    # happens during startup instead of stalling the first request for each worker
+    for _ in range(workers):
+        app.state.spleeter_pool.submit(warm_separation_worker)
+    app.state.separation_batcher = SeparationBatcher(
+        app.state.spleeter_pool, workers, settings.max_separation_batch_size
+    )
+    asyncio.create_task(app.state.separation_batcher.run())
+    # Allow enough jobs in flight for every worker to receive full batches
+    app.state.job_scheduler = JobScheduler(workers * settings.max_separation_batch_size)
+
+    logger.info("Application startup complete (models load in each separation worker)")
+
 
-    # Start model pre-warming in background (don't wait for it)
-    asyncio.create_task(pre_warm_models())
-    logger.info("Application startup complete (models pre-warming in background)")
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Let running jobs finish, persist pending job updates and stop separation workers."""
+    scheduler = getattr(app.state, "job_scheduler", None)
+    if scheduler is not None:
+        await scheduler.close(JOB_SHUTDOWN_GRACE_SECONDS)
+    job_manager.flush(sync=True)
+    pool = getattr(app.state, "spleeter_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 @app.middleware("http")
 async def add_request_id_and_timing(request: Request, call_next):
     """Add request ID and track request timing."""
-    request_id = str(uuid.uuid4())
+    request_id = _new_request_id()
     request.state.request_id = request_id
-    start_time = time.perf_counter()
+    start_time = _perf_counter()
 
     response = await call_next(request)
 
     # Add performance headers
-    elapsed_time = time.perf_counter() - start_time
+    elapsed_time = _perf_counter() - start_time
+    process_time = format(elapsed_time, ".3f")
     response.headers["X-Request-ID"] = request_id
-    response.headers["X-Process-Time"] = f"{elapsed_time:.3f}"
+    response.headers["X-Process-Time"] = process_time
 
-    # Log slow requests
+    # Log slow requests (the message is only built for requests over the threshold)
     if elapsed_time > 1.0:
         logger.warning(
             f"[{request_id}] Slow request: {request.method} {request.url.path} "
-            f"took {elapsed_time:.3f}s"
+            f"took {process_time}s"
         )
 
     return response
@@ -226,13 +631,7 @@ def read_root() -> dict[str, str]:
     Returns:
         API status and usage information
     """
-    return {
-        "message": f"{settings.app_title} is running",
-        "version": settings.app_version,
-        "docs": "/docs",
-        "endpoint": "POST /separate",
-        "description": "Upload an audio file to separate into stems",
-    }
+    return _ROOT_INFO
 
 
 @app.get("/health", tags=["Health"])
@@ -243,14 +642,20 @@ def health_check() -> dict[str, Any]:
     Returns:
         Service health status
     """
+    global _health_cache
+    now = time.monotonic()
+    cached = _health_cache
+    if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
         # Edge case: Check if directories are accessible
-        upload_accessible = os.access(settings.upload_dir, os.W_OK)
-        output_accessible = os.access(settings.output_dir, os.W_OK)
+        upload_accessible = os.access(_UPLOAD_DIR, os.W_OK)
+        output_accessible = os.access(_OUTPUT_DIR, os.W_OK)
 
         # Edge case: Check disk space
         try:
-            statvfs = os.statvfs(settings.upload_dir)
+            statvfs = os.statvfs(_UPLOAD_DIR)
             free_space_gb = (statvfs.f_frsize * statvfs.f_bavail) / (1024**3)
             disk_ok = free_space_gb > 0.2  # At least 200MB free
         except (AttributeError, OSError):
@@ -266,20 +671,23 @@ def health_check() -> dict[str, Any]:
 
         health_data = {
             "status": status,
-            "service": settings.app_title,
-            "version": settings.app_version,
-            "max_file_size_mb": settings.max_file_size_mb,
-            "allowed_extensions": sorted(settings.allowed_extensions),
+            **_HEALTH_STATIC,
             "directories": {
                 "upload_accessible": upload_accessible,
                 "output_accessible": output_accessible,
             },
         }
 
+        tf_threads = getattr(app.state, "tf_threads", None)
+        if tf_threads is not None:
+            health_data["tensorflow_threads"] = tf_threads
+
         if free_space_gb is not None:
             health_data["disk_space_gb"] = round(free_space_gb, 2)
             health_data["disk_ok"] = disk_ok
 
+        with _health_cache_lock:
+            _health_cache = (now, health_data)
         return health_data
 
     except Exception as e:
@@ -292,42 +700,16 @@ def health_check() -> dict[str, Any]:
         }
 
 
-@app.post("/separate", tags=["Separation"], response_model=None)
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
-async def separate_audio(
-    request: Request,
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(..., description="Audio file to separate (MP3, WAV, OGG, FLAC, M4A)"),
-    stems: int = 2,
-    async_mode: bool = True,
-) -> Union[JSONResponse, FileResponse]:
+def _validate_stems(stems: Any) -> int:
     """
-    Separate audio file into stems.
-
-    This endpoint accepts an audio file and separates it into individual stems
-    (vocals, drums, bass, etc.) using Spleeter.
-
-    Args:
-        request: FastAPI request object (for rate limiting)
-        background_tasks: Background tasks for cleanup
-        file: Audio file to separate
-        stems: Number of stems (2, 4, or 5). Default: 2
-        async_mode: If True, returns job ID immediately and processes in background.
-                   If False, waits for completion (may timeout on Railway). Default: True
+    Validate the stems parameter.
 
     Returns:
-        If async_mode=True: JSON with job_id and status endpoint
-        If async_mode=False: ZIP file containing separated audio stems
+        Stem count as an int (2, 4, or 5)
 
     Raises:
-        HTTPException: If validation fails or processing error occurs
+        HTTPException: If the value is not a supported stem count
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    logger.info(
-        f"[{request_id}] Separation request received: filename={file.filename}, "
-        f"stems={stems}, async_mode={async_mode}"
-    )
-
     # Edge case: Validate stems parameter type and value
     try:
         stems_int = int(stems)
@@ -342,27 +724,79 @@ async def separate_audio(
             status_code=400, detail=f"Invalid stems value: {stems_int}. Must be 2, 4, or 5."
         )
 
-    stems = stems_int  # Use validated integer
+    return stems_int
 
-    # Validate file
-    file_ext = spleeter_service.validate_file(file)
 
-    # Generate unique ID for this request
-    unique_id = str(uuid.uuid4())
-    file_path = settings.upload_dir / f"{unique_id}{file_ext}"
+async def _start_separation(
+    request_id: str,
+    background_tasks: BackgroundTasks,
+    file_path: Path,
+    unique_id: str,
+    stems: int,
+    async_mode: bool,
+    content_digest: str | None,
+) -> Union[ORJSONResponse, StreamingResponse]:
+    """
+    Separate a saved upload, as a background job or inline.
 
-    logger.info(f"[{request_id}] Processing file: {file_path}")
+    Uploads whose content was separated before are answered from the result cache,
+    skipping Spleeter entirely.
+
+    Args:
+        request_id: Request identifier for logging
+        background_tasks: Background tasks for cleanup
+        file_path: Path of the saved upload
+        unique_id: Upload identifier, used in the download filename
+        stems: Validated number of stems
+        async_mode: Return a job immediately instead of waiting for the result
+        content_digest: Content digest of the upload, or None if caching is disabled
+
+    Returns:
+        202 JSON with the job_id in async mode, otherwise the streamed ZIP of stems
+    """
+    # Edge case: Sanitize filename for safe download
+    safe_filename = f"separated_{stems}stems_{unique_id[:8]}.zip"
+    # Remove any potentially dangerous characters
+    safe_filename = _UNSAFE_FILENAME_CHARS.sub("", safe_filename)
+
+    # Repeat uploads: the cached stems are hard-linked into this request's own output
+    # directory, which is then handled exactly like a fresh separation's output, so
+    # evicting the cache entry later cannot break the download
+    output_folder_path = _OUTPUT_DIR / file_path.stem
+    restored = content_digest is not None and await run_in_threadpool(
+        spleeter_service.restore_cached_result, content_digest, stems, output_folder_path
+    )
 
-    # Save uploaded file
-    spleeter_service.save_upload(file, file_path)
+    if restored and async_mode:
+        logger.info(f"[{request_id}] Serving cached result: {output_folder_path}")
+        # The job is created already completed
+        job = await job_manager.create_job(file_path, stems)
+        await job_manager.update_job_status(
+            job.job_id, JobStatus.COMPLETED, progress=1.0, result_path=output_folder_path
+        )
+        schedule_cleanup(job.job_id, [file_path, output_folder_path], RESULT_RETENTION_SECONDS)
+        return ORJSONResponse(
+            status_code=202,  # Accepted
+            content={
+                "job_id": job.job_id,
+                "status": "completed",
+                "message": "This audio was separated before. The result is ready.",
+                "status_url": f"/jobs/{job.job_id}/status",
+                "result_url": f"/jobs/{job.job_id}/result",
+            },
+            headers={"X-Request-ID": request_id},
+        )
 
     # Async mode: Create job and return immediately
     if async_mode:
-        job = job_manager.create_job(file_path, stems)
+        job = await job_manager.create_job(file_path, stems)
         # Start background processing
-        asyncio.create_task(process_separation_job(job.job_id, file_path, stems))
+        app.state.job_scheduler.spawn(
+            process_separation_job(job.job_id, file_path, stems, content_digest),
+            name=job.job_id,
+        )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,  # Accepted
             content={
                 "job_id": job.job_id,
@@ -378,80 +812,173 @@ async def separate_audio(
     cleanup_paths = [file_path]
 
     try:
-        # Run Spleeter separation in thread pool (CPU bound / Blocking I/O)
-        output_folder_path = await run_in_threadpool(
-            spleeter_service.run_separation, file_path, stems
-        )
+        if restored:
+            logger.info(f"[{request_id}] Serving cached result: {output_folder_path}")
+        else:
+            # Run Spleeter separation in a worker process (CPU bound)
+            output_folder_path = await run_separation_in_pool(file_path, stems)
         cleanup_paths.append(output_folder_path)
 
-        # Create zip file
-        zip_path = settings.output_dir / f"{unique_id}.zip"
-        cleanup_paths.append(zip_path)
+        # The zip is streamed straight into the response, never written to disk;
+        # the stems are checked here so problems still surface as HTTP errors
+        zip_stream = await run_in_threadpool(spleeter_service.stream_zip, output_folder_path)
 
-        # Create zip in thread pool (I/O bound)
-        await run_in_threadpool(spleeter_service.create_zip, output_folder_path, zip_path)
-
-        logger.info(f"[{request_id}] Separation completed: {zip_path}")
+        logger.info(f"[{request_id}] Separation completed: {output_folder_path}")
 
     except HTTPException:
         # Re-raise HTTP exceptions (already properly formatted)
-        spleeter_service.cleanup_files(cleanup_paths)
+        await run_in_threadpool(spleeter_service.cleanup_files, cleanup_paths)
         raise
     except Exception as e:
         # Catch any unexpected errors
         logger.error(f"[{request_id}] Unexpected error during separation: {e}", exc_info=True)
-        spleeter_service.cleanup_files(cleanup_paths)
+        await run_in_threadpool(spleeter_service.cleanup_files, cleanup_paths)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred during audio separation. Please try again.",
         ) from e
 
-    # Edge case: Verify zip file exists and is readable before returning
-    if not zip_path.exists():
-        logger.error(f"[{request_id}] Zip file not found after creation: {zip_path}")
-        spleeter_service.cleanup_files(cleanup_paths)
-        raise HTTPException(status_code=500, detail="Output file was not created correctly.")
-
-    # Edge case: Check zip file size
-    try:
-        zip_size = zip_path.stat().st_size
-        if zip_size == 0:
-            logger.error(f"[{request_id}] Zip file is empty: {zip_path}")
-            spleeter_service.cleanup_files(cleanup_paths)
-            raise HTTPException(status_code=500, detail="Output zip file is empty.")
-        logger.info(f"[{request_id}] Zip file size: {zip_size / (1024 * 1024):.2f}MB")
-    except OSError as e:
-        logger.error(f"[{request_id}] Could not stat zip file: {e}")
-        spleeter_service.cleanup_files(cleanup_paths)
-        raise HTTPException(status_code=500, detail="Could not access output file.") from e
-
-    # Schedule cleanup after response is sent
+    # After the response is sent: keep the result for repeat uploads of the same
+    # audio, then clean up (background tasks run in order)
+    if not restored:
+        background_tasks.add_task(
+            spleeter_service.cache_result, content_digest, stems, output_folder_path
+        )
     background_tasks.add_task(spleeter_service.cleanup_files, cleanup_paths)
 
-    # Edge case: Sanitize filename for safe download
-    safe_filename = f"separated_{stems}stems_{unique_id[:8]}.zip"
-    # Remove any potentially dangerous characters
-    safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
-
-    return FileResponse(
-        zip_path,
+    return StreamingResponse(
+        zip_stream,
         media_type="application/zip",
-        filename=safe_filename,
         headers={
             "X-Request-ID": request_id,
             "Content-Disposition": f'attachment; filename="{safe_filename}"',
-            "Content-Length": str(zip_size),
         },
     )
 
 
+@app.post("/separate", tags=["Separation"], response_model=None)
+@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+async def separate_audio(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="Audio file to separate (MP3, WAV, OGG, FLAC, M4A)"),
+    stems: int = 2,
+    async_mode: bool = True,
+) -> Union[ORJSONResponse, StreamingResponse]:
+    """
+    Separate audio file into stems.
+
+    This endpoint accepts an audio file and separates it into individual stems
+    (vocals, drums, bass, etc.) using Spleeter.
+
+    Args:
+        request: FastAPI request object (for rate limiting)
+        background_tasks: Background tasks for cleanup
+        file: Audio file to separate
+        stems: Number of stems (2, 4, or 5). Default: 2
+        async_mode: If True, returns job ID immediately and processes in background.
+                   If False, waits for completion (may timeout on Railway). Default: True
+
+    Returns:
+        If async_mode=True: JSON with job_id and status endpoint
+        If async_mode=False: ZIP file containing separated audio stems, streamed as it
+            is built
+
+    Raises:
+        HTTPException: If validation fails or processing error occurs
+    """
+    request_id = getattr(request.state, "request_id", "unknown")
+    logger.info(
+        f"[{request_id}] Separation request received: filename={file.filename}, "
+        f"stems={stems}, async_mode={async_mode}"
+    )
+
+    stems = _validate_stems(stems)
+
+    # Validate file
+    file_ext = spleeter_service.validate_file(file)
+
+    # Generate unique ID for this request
+    unique_id = secrets.token_hex(16)
+    file_path = _UPLOAD_DIR / f"{unique_id}{file_ext}"
+
+    logger.info(f"[{request_id}] Processing file: {file_path}")
+
+    # Stream uploaded file to disk
+    content_digest = await spleeter_service.save_upload(file, file_path)
+
+    return await _start_separation(
+        request_id, background_tasks, file_path, unique_id, stems, async_mode, content_digest
+    )
+
+
+@app.post("/separate/raw", tags=["Separation"], response_model=None)
+@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+async def separate_audio_raw(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    filename: str,
+    stems: int = 2,
+    async_mode: bool = True,
+) -> Union[ORJSONResponse, StreamingResponse]:
+    """
+    Separate audio sent as the raw request body into stems.
+
+    Behaves like /separate, but the body is the audio file itself instead of a
+    multipart form, so it is written to disk as it arrives rather than being spooled
+    by the form parser and copied again.
+
+    Args:
+        request: FastAPI request object (body is the audio file)
+        background_tasks: Background tasks for cleanup
+        filename: Original filename, used to validate the file type
+        stems: Number of stems (2, 4, or 5). Default: 2
+        async_mode: If True, returns job ID immediately and processes in background.
+                   If False, waits for completion (may timeout on Railway). Default: True
+
+    Returns:
+        If async_mode=True: JSON with job_id and status endpoint
+        If async_mode=False: ZIP file containing separated audio stems, streamed as it
+            is built
+
+    Raises:
+        HTTPException: If validation fails or processing error occurs
+    """
+    request_id = getattr(request.state, "request_id", "unknown")
+    logger.info(
+        f"[{request_id}] Raw separation request received: filename={filename}, "
+        f"stems={stems}, async_mode={async_mode}"
+    )
+
+    stems = _validate_stems(stems)
+
+    # Content-Length lets oversized uploads be rejected before any body is read
+    content_length = request.headers.get("content-length")
+    size = int(content_length) if content_length and content_length.isdigit() else None
+    file_ext = spleeter_service.validate_filename(filename, size)
+
+    # Generate unique ID for this request
+    unique_id = secrets.token_hex(16)
+    file_path = _UPLOAD_DIR / f"{unique_id}{file_ext}"
+
+    logger.info(f"[{request_id}] Processing file: {file_path}")
+
+    content_digest = await spleeter_service.save_stream(request.stream(), file_path)
+
+    return await _start_separation(
+        request_id, background_tasks, file_path, unique_id, stems, async_mode, content_digest
+    )
+
+
 @app.get("/jobs/{job_id}/status", tags=["Separation"])
-def get_job_status(job_id: str) -> dict[str, Any]:
+async def get_job_status(job_id: str, wait: float = 0) -> ORJSONResponse:
     """
     Get the status of a separation job.
 
     Args:
         job_id: Job identifier returned from /separate endpoint
+        wait: Long-poll: seconds (up to 25) to wait for the job to change before
+            answering; 0 answers immediately
 
     Returns:
         Job status information including progress and result URL
@@ -459,18 +986,31 @@ def get_job_status(job_id: str) -> dict[str, Any]:
     Raises:
         HTTPException: If job not found
     """
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    return {
-        "status": "ok",
-        "job": job.to_dict(),
-    }
+    # Edge case: Finished jobs never change, so there is nothing to wait for
+    if wait > 0 and job.status in (JobStatus.PENDING, JobStatus.PROCESSING):
+        await job_manager.wait_for_update(
+            job_id, job.status, job.progress, min(wait, LONG_POLL_MAX_SECONDS)
+        )
+        job = await job_manager.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    # Returned as a response directly so the payload is encoded once by orjson,
+    # skipping FastAPI's jsonable_encoder pass over the dict
+    return ORJSONResponse(
+        {
+            "status": "ok",
+            "job": job.to_dict(),
+        }
+    )
 
 
 @app.get("/jobs/{job_id}/result", tags=["Separation"], response_model=None)
-def get_job_result(job_id: str) -> Union[FileResponse, JSONResponse]:
+async def get_job_result(job_id: str) -> Union[FileResponse, StreamingResponse, ORJSONResponse]:
     """
     Download the result of a completed separation job.
 
@@ -483,41 +1023,71 @@ def get_job_result(job_id: str) -> Union[FileResponse, JSONResponse]:
     Raises:
         HTTPException: If job not found or not completed
     """
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
     if job.status != JobStatus.COMPLETED:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,
             content={
                 "status": "not_ready",
                 "job_id": job_id,
-                "current_status": job.status.value,
+                "current_status": job.status,
                 "message": "Job is still processing. Please check status endpoint.",
                 "status_url": f"/jobs/{job_id}/status",
             },
         )
 
-    if not job.result_path or not job.result_path.exists():
+    if not job.result_path:
         raise HTTPException(
             status_code=500, detail="Result file not found. Job may have been cleaned up."
         )
 
-    try:
-        zip_size = job.result_path.stat().st_size
-        safe_filename = f"separated_{job.stems}stems_{job_id[:8]}.zip"
-        safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
+    # Checking the result touches the filesystem; keep it off the event loop
+    return await run_in_threadpool(_result_response, job_id, job.stems, job.result_path)
 
-        return FileResponse(
-            job.result_path,
+
+def _result_response(
+    job_id: str, stems: int, result_path: Path
+) -> Union[FileResponse, StreamingResponse]:
+    """
+    Build the download response for a completed job's result (blocking operation).
+
+    Raises:
+        HTTPException: If the result is missing or unreadable
+    """
+    try:
+        # The stat result also gives the response its Content-Length, so the file
+        # is stat'ed once per download
+        zip_stat = _os_stat(result_path)
+        safe_filename = f"separated_{stems}stems_{job_id[:8]}.zip"
+        safe_filename = _UNSAFE_FILENAME_CHARS.sub("", safe_filename)
+
+        if stat.S_ISDIR(zip_stat.st_mode):
+            # Stems directory: zip it on the fly straight into the response
+            return StreamingResponse(
+                spleeter_service.stream_zip(result_path),
+                media_type="application/zip",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{safe_filename}"',
+                },
+            )
+
+        # Zip archive written by an older version of the service
+        return ZipFileResponse(
+            result_path,
             media_type="application/zip",
             filename=safe_filename,
+            stat_result=zip_stat,
             headers={
                 "Content-Disposition": f'attachment; filename="{safe_filename}"',
-                "Content-Length": str(zip_size),
             },
         )
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=500, detail="Result file not found. Job may have been cleaned up."
+        ) from None
     except OSError as e:
         logger.error(f"Error accessing result file for job {job_id}: {e}")
         raise HTTPException(status_code=500, detail="Could not access result file.") from e
@@ -532,6 +1102,14 @@ def get_performance_metrics() -> dict[str, Any]:
         Performance statistics
     """
     try:
+        if not settings.enable_perf_tracking:
+            return {
+                "status": "ok",
+                "metrics": {},
+                "message": "Performance tracking not enabled",
+                "timestamp": time.time(),
+            }
+
         from app.performance import get_performance_stats
 
         stats = get_performance_stats()
@@ -557,11 +1135,11 @@ def get_performance_metrics() -> dict[str, Any]:
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for unexpected errors."""
     request_id = getattr(request.state, "request_id", "unknown")
     logger.error(f"[{request_id}] Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
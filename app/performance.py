@@ -2,114 +2,169 @@
 Performance monitoring and profiling utilities.
 """
 
+import asyncio
 import functools
 import logging
+import math
 import time
 import tracemalloc
+from array import array
 from collections.abc import Callable
 from contextlib import contextmanager
 from typing import Any
 
+import numpy as np
+
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Global performance metrics
-_performance_metrics: dict[str, list] = {}
+# Calls kept per function; older metrics are overwritten so memory stays bounded
+PERFORMANCE_HISTORY_SIZE = 1000
+
+
+class _MetricHistory:
+    """
+    Ring buffers of a function's most recent execution times (ns) and peak memory (MB,
+    NaN when memory was not traced). Fixed-size, so they are never resized while
+    get_performance_stats holds a view of them.
+    """
+
+    __slots__ = ("execution_times", "memory_usage", "calls")
+
+    def __init__(self) -> None:
+        self.execution_times = array("q", bytes(8 * PERFORMANCE_HISTORY_SIZE))
+        self.memory_usage = array("d", bytes(8 * PERFORMANCE_HISTORY_SIZE))
+        self.calls = 0
+
+    def record(self, execution_time_ns: int, peak_memory: float) -> None:
+        """Store one call's metrics, overwriting the oldest once the buffers are full."""
+        index = self.calls % PERFORMANCE_HISTORY_SIZE
+        self.execution_times[index] = execution_time_ns
+        self.memory_usage[index] = peak_memory
+        self.calls += 1
+
+
+# Calls slower than this are logged as warnings
+SLOW_OPERATION_NS = 1_000_000_000
+
+# Global performance metrics per function
+_performance_metrics: dict[str, _MetricHistory] = {}
+
+# Take a full tracemalloc snapshot (to log the top allocation site) on one call in N;
+# every other call only reads tracemalloc's current/peak counters
+MEMORY_SNAPSHOT_SAMPLE_EVERY = 100
+_memory_sample_counter = 0
+
+
+def _take_memory_sample() -> bool:
+    """Return True on every MEMORY_SNAPSHOT_SAMPLE_EVERY-th tracked call."""
+    global _memory_sample_counter
+    _memory_sample_counter += 1
+    return _memory_sample_counter % MEMORY_SNAPSHOT_SAMPLE_EVERY == 0
+
+
+def _log_top_allocation(func_name: str, start_snapshot: tracemalloc.Snapshot) -> None:
+    """Log the source line whose allocations grew most since start_snapshot."""
+    top_stats = tracemalloc.take_snapshot().compare_to(start_snapshot, "lineno")
+    if top_stats:
+        logger.debug(f"{func_name} top allocation: {top_stats[0]}")
+
+
+def _begin() -> tuple[int, int | None, tracemalloc.Snapshot | None]:
+    """
+    Start measuring a tracked call.
+
+    Returns:
+        Start time (ns), traced memory at start (None when not tracing) and the start
+        snapshot on sampled calls
+    """
+    start_memory = None
+    start_snapshot = None
+
+    # Track memory if tracemalloc is active (O(1) counters; snapshots only sampled)
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        if _take_memory_sample():
+            start_snapshot = tracemalloc.take_snapshot()
+
+    return time.perf_counter_ns(), start_memory, start_snapshot
+
+
+def _end(
+    func_name: str,
+    metrics: _MetricHistory,
+    state: tuple[int, int | None, tracemalloc.Snapshot | None],
+) -> None:
+    """
+    Finish measuring a tracked call and record its metrics.
+
+    Args:
+        func_name: Qualified name of the tracked function
+        metrics: The function's history in _performance_metrics
+        state: Value returned by _begin for this call
+    """
+    start_time, start_memory, start_snapshot = state
+    # Integer nanoseconds: no float allocated per call; converted when stats are read
+    execution_time_ns = time.perf_counter_ns() - start_time
+    peak_memory = None
+
+    # Calculate peak memory above the starting point if tracking
+    if start_memory is not None and tracemalloc.is_tracing():
+        _, peak = tracemalloc.get_traced_memory()
+        peak_memory = (peak - start_memory) / (1024 * 1024)  # MB
+        if start_snapshot is not None:
+            _log_top_allocation(func_name, start_snapshot)
+
+    # Store metrics
+    metrics.record(execution_time_ns, math.nan if peak_memory is None else peak_memory)
+
+    # Log slow operations (>1 second)
+    if execution_time_ns > SLOW_OPERATION_NS:
+        logger.warning(f"Slow operation detected: {func_name} took {execution_time_ns / 1e9:.2f}s")
 
 
 def track_performance(func: Callable) -> Callable:
     """
     Decorator to track function execution time and memory usage.
 
+    Returns func unchanged when settings.enable_perf_tracking is off, so untracked
+    deployments pay no per-call overhead.
+
     Args:
         func: Function to track
 
     Returns:
         Wrapped function with performance tracking
     """
+    if not settings.enable_perf_tracking:
+        return func
 
-    @functools.wraps(func)
-    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-        func_name = f"{func.__module__}.{func.__name__}"
-        start_time = time.perf_counter()
-        start_memory = None
-        peak_memory = None
+    func_name = f"{func.__module__}.{func.__name__}"
+    # Bound once so each call records without a dict lookup
+    metrics = _performance_metrics.setdefault(func_name, _MetricHistory())
 
-        # Track memory if tracemalloc is active
-        if tracemalloc.is_tracing():
-            start_memory = tracemalloc.take_snapshot()
+    if asyncio.iscoroutinefunction(func):
 
-        try:
-            result = await func(*args, **kwargs)
-            return result
-        finally:
-            end_time = time.perf_counter()
-            execution_time = end_time - start_time
-
-            # Calculate memory delta if tracking
-            if start_memory and tracemalloc.is_tracing():
-                end_memory = tracemalloc.take_snapshot()
-                top_stats = end_memory.compare_to(start_memory, "lineno")
-                if top_stats:
-                    peak_memory = top_stats[0].size_diff / (1024 * 1024)  # MB
-
-            # Store metrics
-            if func_name not in _performance_metrics:
-                _performance_metrics[func_name] = []
-            _performance_metrics[func_name].append(
-                {
-                    "execution_time": execution_time,
-                    "peak_memory_mb": peak_memory,
-                }
-            )
-
-            # Log slow operations (>1 second)
-            if execution_time > 1.0:
-                logger.warning(f"Slow operation detected: {func_name} took {execution_time:.2f}s")
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            state = _begin()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _end(func_name, metrics, state)
+
+        return async_wrapper
 
     @functools.wraps(func)
     def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-        func_name = f"{func.__module__}.{func.__name__}"
-        start_time = time.perf_counter()
-        start_memory = None
-        peak_memory = None
-
-        # Track memory if tracemalloc is active
-        if tracemalloc.is_tracing():
-            start_memory = tracemalloc.take_snapshot()
-
+        state = _begin()
         try:
-            result = func(*args, **kwargs)
-            return result
+            return func(*args, **kwargs)
         finally:
-            end_time = time.perf_counter()
-            execution_time = end_time - start_time
-
-            # Calculate memory delta if tracking
-            if start_memory and tracemalloc.is_tracing():
-                end_memory = tracemalloc.take_snapshot()
-                top_stats = end_memory.compare_to(start_memory, "lineno")
-                if top_stats:
-                    peak_memory = top_stats[0].size_diff / (1024 * 1024)  # MB
-
-            # Store metrics
-            if func_name not in _performance_metrics:
-                _performance_metrics[func_name] = []
-            _performance_metrics[func_name].append(
-                {
-                    "execution_time": execution_time,
-                    "peak_memory_mb": peak_memory,
-                }
-            )
-
-            # Log slow operations (>1 second)
-            if execution_time > 1.0:
-                logger.warning(f"Slow operation detected: {func_name} took {execution_time:.2f}s")
-
-    # Return appropriate wrapper based on function type
-    import asyncio
+            _end(func_name, metrics, state)
 
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
 
 
@@ -144,43 +199,58 @@ def measure_memory(operation_name: str):
         None
     """
     if not tracemalloc.is_tracing():
-        tracemalloc.start()
+        tracemalloc.start(1)
 
-    start_snapshot = tracemalloc.take_snapshot()
+    # Counters are O(1); snapshots would walk every traced allocation twice
+    tracemalloc.reset_peak()
+    start_memory, _ = tracemalloc.get_traced_memory()
     try:
         yield
     finally:
-        end_snapshot = tracemalloc.take_snapshot()
-        top_stats = end_snapshot.compare_to(start_snapshot, "lineno")
-
-        if top_stats:
-            total_memory = sum(stat.size_diff for stat in top_stats)
-            logger.debug(f"{operation_name} used {total_memory / (1024 * 1024):.2f}MB")
+        end_memory, peak = tracemalloc.get_traced_memory()
+        logger.debug(
+            f"{operation_name} used {(end_memory - start_memory) / (1024 * 1024):.2f}MB "
+            f"(peak delta {(peak - start_memory) / (1024 * 1024):.2f}MB)"
+        )
 
 
 def get_performance_stats() -> dict[str, dict[str, float]]:
     """
-    Get aggregated performance statistics.
+    Get aggregated performance statistics per function.
+
+    ``count`` is the total number of calls; the timing and memory figures cover the
+    last ``sample_size`` of them (at most PERFORMANCE_HISTORY_SIZE).
 
     Returns:
         Dictionary of function names to their performance stats
     """
+    if not settings.enable_perf_tracking:
+        logger.warning("Performance stats requested but ENABLE_PERF_TRACKING is off")
+        return {}
+
     stats = {}
     for func_name, metrics in _performance_metrics.items():
-        if not metrics:
+        samples = min(metrics.calls, PERFORMANCE_HISTORY_SIZE)
+        if not samples:
             continue
 
-        execution_times = [m["execution_time"] for m in metrics if m["execution_time"]]
-        memory_usage = [m["peak_memory_mb"] for m in metrics if m.get("peak_memory_mb") is not None]
+        # Zero-copy views over the filled part of the ring buffers; times in seconds
+        execution_times = np.frombuffer(metrics.execution_times, dtype=np.int64)[:samples] / 1e9
+        memory_usage = np.frombuffer(metrics.memory_usage, dtype=np.float64)[:samples]
+        memory_usage = memory_usage[~np.isnan(memory_usage)]
 
+        total_time = float(execution_times.sum())
         stats[func_name] = {
-            "count": len(metrics),
-            "avg_time": sum(execution_times) / len(execution_times) if execution_times else 0,
-            "min_time": min(execution_times) if execution_times else 0,
-            "max_time": max(execution_times) if execution_times else 0,
-            "total_time": sum(execution_times),
-            "avg_memory_mb": sum(memory_usage) / len(memory_usage) if memory_usage else None,
-            "max_memory_mb": max(memory_usage) if memory_usage else None,
+            # Every call since the last reset; the timings below cover only the most
+            # recent sample_size of them
+            "count": metrics.calls,
+            "sample_size": samples,
+            "avg_time": total_time / samples,
+            "min_time": float(execution_times.min()),
+            "max_time": float(execution_times.max()),
+            "total_time": total_time,
+            "avg_memory_mb": float(memory_usage.mean()) if memory_usage.size else None,
+            "max_memory_mb": float(memory_usage.max()) if memory_usage.size else None,
         }
 
     return stats
@@ -188,5 +258,6 @@ def get_performance_stats() -> dict[str, dict[str, float]]:
 
 def reset_performance_stats() -> None:
     """Reset all performance statistics."""
-    global _performance_metrics
-    _performance_metrics = {}
+    # Cleared in place: decorated functions hold references to their histories
+    for metrics in _performance_metrics.values():
+        metrics.calls = 0
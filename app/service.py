@@ -1,18 +1,341 @@
+import errno
+import functools
+import hashlib
+import io
 import logging
+import mmap
 import os
+import queue
+import re
 import shutil
+import subprocess
+import sys
+import threading
+import time
 import zipfile
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from fastapi import HTTPException, UploadFile
-from spleeter.separator import Separator
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 
 from app.config import settings
 
+# Spleeter imports TensorFlow, so it is only imported where models are built: inside
+# the separation workers, never in the API process
+if TYPE_CHECKING:
+    from spleeter.separator import Separator
+
 logger = logging.getLogger(__name__)
 
-# Cache for Separator instances to avoid recreating models
-_SEPARATOR_CACHE: dict[str, Separator | None] = {}
+# Optional: SIMD-accelerated CRC-32 for zip entries (pip install isal, or zlib-ng);
+# both fall back to portable code on CPUs without the instructions
+try:
+    from isal import isal_zlib
+
+    zipfile.crc32 = isal_zlib.crc32  # type: ignore[attr-defined]
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng
+
+        zipfile.crc32 = zlib_ng.crc32  # type: ignore[attr-defined]
+    except ImportError:
+        pass
+
+# Chunk size for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Safety limit on the total size of stems put into one zip (500MB)
+MAX_ZIP_SIZE_BYTES = 500 * 1024 * 1024
+
+# Chunks a zip member's reader thread may get ahead of the thread writing the archive
+ZIP_READ_AHEAD_CHUNKS = 4
+
+# Digest size of the upload content hash that keys the result cache (128 bits)
+CONTENT_DIGEST_SIZE = 16
+
+
+# Disk checks made before each upload are reused for this long; free space and
+# directory permissions barely change between back-to-back uploads
+DISK_CHECK_TTL_SECONDS = 5.0
+_free_space_cache: tuple[float, int] | None = None
+# Directory -> time it was last found writable (failures are never cached)
+_writable_dir_cache: dict[Path, float] = {}
+
+
+def _cached_free_space(path: Path) -> int:
+    """
+    Free bytes available to unprivileged users on path's filesystem, cached briefly.
+
+    Raises:
+        AttributeError: On platforms without os.statvfs (Windows)
+        OSError: If the filesystem cannot be queried
+    """
+    cached = _free_space_cache
+    if cached is not None and time.monotonic() - cached[0] < DISK_CHECK_TTL_SECONDS:
+        return cached[1]
+    return refresh_free_space(path)
+
+
+def refresh_free_space(path: Path) -> int:
+    """
+    Query free space on path's filesystem and update the cache uploads read from.
+
+    Called periodically from a background task so uploads normally find a fresh
+    value and make no statvfs call themselves.
+
+    Returns:
+        Free bytes available to unprivileged users
+
+    Raises:
+        AttributeError: On platforms without os.statvfs (Windows)
+        OSError: If the filesystem cannot be queried
+    """
+    global _free_space_cache
+    statvfs = os.statvfs(path)
+    free_space = statvfs.f_frsize * statvfs.f_bavail
+    _free_space_cache = (time.monotonic(), free_space)
+    return free_space
+
+
+def _is_writable_dir(path: Path) -> bool:
+    """Check write permission on a directory, caching positive results briefly."""
+    now = time.monotonic()
+    checked_at = _writable_dir_cache.get(path)
+    if checked_at is not None and now - checked_at < DISK_CHECK_TTL_SECONDS:
+        return True
+    if not os.access(path, os.W_OK):
+        return False
+    _writable_dir_cache[path] = now
+    return True
+
+
+def _new_content_hasher() -> Any:
+    """Return a hasher for upload content, or None if the result cache is disabled."""
+    if settings.result_cache_size <= 0:
+        return None
+    # BLAKE2b is the fastest cryptographic hash in hashlib and releases the GIL
+    return hashlib.blake2b(digest_size=CONTENT_DIGEST_SIZE)
+
+
+def _link_tree(source_dir: Path, destination: Path) -> None:
+    """
+    Recreate a directory tree at destination with files hard-linked, not copied.
+
+    Falls back to copying where hard links are unavailable (e.g. across filesystems).
+
+    Raises:
+        OSError: If the tree cannot be linked or copied
+    """
+    try:
+        shutil.copytree(source_dir, destination, copy_function=os.link)
+    except shutil.Error as e:
+        # copytree collects per-file errors; retry by copying if the links failed
+        shutil.rmtree(destination, ignore_errors=True)
+        logger.debug("Hard links unavailable (%s), copying %s", e, source_dir)
+        shutil.copytree(source_dir, destination)
+
+
+def _write_batch(out: BinaryIO, chunks: list[bytes], hasher: Any) -> None:
+    """Write a batch of upload chunks, feeding them to hasher if there is one."""
+    out.writelines(chunks)
+    if hasher is not None:
+        for chunk in chunks:
+            hasher.update(chunk)
+
+
+def _scan_zip_entries(source_dir: Path) -> Iterator[tuple[str, str, os.stat_result]]:
+    """
+    Yield (path, arcname, stat) for every regular file under a directory.
+
+    Uses os.scandir, so file types come from the directory entries, each file costs
+    a single stat, and no Path objects are built per file. Symlinks and special
+    files are skipped; arcnames are relative to source_dir with "/" separators.
+
+    Args:
+        source_dir: Directory to scan
+
+    Raises:
+        OSError: If a directory cannot be listed
+    """
+    prefix_len = len(str(source_dir)) + 1
+    pending = [str(source_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+
+                # Edge case: Skip if not a regular file (symlink, etc.)
+                if not entry.is_file(follow_symlinks=False):
+                    logger.warning("Skipping non-file: %s", entry.path)
+                    continue
+
+                # Edge case: File removed or unreadable since the directory was listed
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError as e:
+                    logger.warning("Could not get size for %s: %s", entry.path, e)
+                    continue
+
+                arcname = entry.path[prefix_len:]
+                if os.sep != "/":
+                    arcname = arcname.replace(os.sep, "/")
+                yield entry.path, arcname, stat
+
+
+def _zip_member_info(
+    file_path: str, arcname: str, stat: os.stat_result, deflate_pcm: bool
+) -> zipfile.ZipInfo:
+    """
+    Build a member's ZipInfo from an existing stat, as ZipInfo.from_file would.
+
+    Args:
+        file_path: Path of the file being added
+        arcname: Name of the member inside the archive
+        stat: The file's stat from _scan_zip_entries (avoids a second stat)
+        deflate_pcm: Compress WAV members at the fastest DEFLATE level
+
+    Returns:
+        ZipInfo ready for ZipFile.open(..., "w")
+    """
+    # Edge case: Zip timestamps cannot predate 1980
+    date_time = max(time.localtime(stat.st_mtime)[:6], (1980, 1, 1, 0, 0, 0))
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (stat.st_mode & 0xFFFF) << 16
+    zinfo.file_size = stat.st_size
+    if deflate_pcm and file_path[-4:].lower() == ".wav":
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        # Same attribute ZipFile.write sets for its compresslevel argument
+        zinfo._compresslevel = 1
+    return zinfo
+
+
+def _advise_sequential(fd: int) -> None:
+    """Tell the kernel a file will be read front to back, so it reads ahead further."""
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        # Edge case: Not available on this platform (Windows/macOS) or file type
+        pass
+
+
+def _read_ahead(src: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield an open file's contents in UPLOAD_CHUNK_SIZE chunks read by a helper thread.
+
+    The thread reads up to ZIP_READ_AHEAD_CHUNKS chunks ahead, so disk reads overlap
+    with the CRC, compression and writes done by the consumer. Closing the generator
+    early stops the thread.
+
+    Args:
+        src: File opened for binary reading (closed by the caller)
+
+    Raises:
+        OSError: If reading the file fails
+    """
+    chunks: queue.Queue[bytes | Exception] = queue.Queue(ZIP_READ_AHEAD_CHUNKS)
+    stop = threading.Event()
+
+    def put(item: bytes | Exception) -> None:
+        # Time out periodically so an abandoned reader notices stop
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def read() -> None:
+        try:
+            while not stop.is_set():
+                chunk = src.read(UPLOAD_CHUNK_SIZE)
+                put(chunk)
+                if not chunk:
+                    return
+        except (OSError, ValueError) as e:
+            # ValueError: the caller closed the file after abandoning the generator
+            put(e)
+
+    _advise_sequential(src.fileno())
+    threading.Thread(target=read, name="zip-read-ahead", daemon=True).start()
+    try:
+        while True:
+            item = chunks.get()
+            if isinstance(item, Exception):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+class _ZipChunkSink(io.RawIOBase):
+    """Unseekable write target that collects a streamed zip's bytes until drained."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# copy_file_range errors meaning "not possible between these files", not I/O failures
+_COPY_RANGE_UNSUPPORTED = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+
+# Characters rejected in uploaded filenames
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"|?*\x00]')
+
+# Cache for Separator instances to avoid recreating models, least recently used first.
+# Sized to hold every model (2, 4 and 5 stems), so mixed traffic never reloads one.
+SEPARATOR_CACHE_SIZE = 3
+_SEPARATOR_CACHE: OrderedDict[str, "Separator"] = OrderedDict()
+_SEPARATOR_CACHE_LOCK = threading.Lock()
+
+
+# Set once TensorFlow's per-process device configuration has been applied
+_tf_configured = False
+
+
+def _configure_tensorflow_once() -> None:
+    """
+    Enable GPU memory growth once per process, before any model is built.
+
+    TensorFlow ignores device configuration after its runtime has initialized, so
+    this runs before the first Separator is created; later calls return immediately.
+    Thread counts are pinned separately by configure_tf_threads.
+    """
+    global _tf_configured
+    if _tf_configured:
+        return
+    _tf_configured = True
+
+    import tensorflow as tf
+
+    # Limit TensorFlow memory growth to prevent OOM errors
+    gpus = tf.config.list_physical_devices("GPU")
+    if gpus:
+        try:
+            for gpu in gpus:
+                tf.config.experimental.set_memory_growth(gpu, True)
+        except RuntimeError as e:
+            logger.warning("GPU memory growth setting failed: %s", e)
 
 
 class SpleeterService:
@@ -24,8 +347,9 @@ class SpleeterService:
         settings.upload_dir.mkdir(parents=True, exist_ok=True)
         settings.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(
-            f"SpleeterService initialized. Upload dir: {settings.upload_dir}, "
-            f"Output dir: {settings.output_dir}"
+            "SpleeterService initialized. Upload dir: %s, Output dir: %s",
+            settings.upload_dir,
+            settings.output_dir,
         )
 
     def validate_file(self, file: UploadFile) -> str:
@@ -38,79 +362,193 @@ class SpleeterService:
         Returns:
             The file extension (lowercase)
 
+        Raises:
+            HTTPException: If file is invalid
+        """
+        return self.validate_filename(file.filename, getattr(file, "size", None))
+
+    def validate_filename(self, filename: str | None, size: int | None) -> str:
+        """
+        Validates an upload's filename and, when known in advance, its size.
+
+        Args:
+            filename: Client-supplied filename
+            size: Upload size in bytes, or None if not known yet
+
+        Returns:
+            The file extension (lowercase)
+
         Raises:
             HTTPException: If file is invalid
         """
         # Edge case: Missing filename
-        if not file.filename:
+        if not filename:
             raise HTTPException(
                 status_code=400, detail="Filename is missing. Please provide a valid filename."
             )
 
         # Edge case: Filename too long (prevent path issues)
-        if len(file.filename) > 255:
+        if len(filename) > 255:
             raise HTTPException(
                 status_code=400, detail="Filename is too long. Maximum length is 255 characters."
             )
 
-        # Edge case: Invalid characters in filename (optimized: use set for O(1) lookup)
-        invalid_chars = {"<", ">", ":", '"', "|", "?", "*", "\x00"}
-        if any(char in invalid_chars for char in file.filename):
+        # Edge case: Invalid characters in filename (single C-level regex scan)
+        if _INVALID_FILENAME_CHARS.search(filename):
             raise HTTPException(status_code=400, detail="Filename contains invalid characters.")
 
         # Edge case: No extension
-        file_ext = Path(file.filename).suffix.lower()
+        file_ext = os.path.splitext(filename)[1].lower()
         if not file_ext:
             raise HTTPException(
                 status_code=400,
-                detail="File must have an extension. Allowed types: "
-                + f"{', '.join(sorted(settings.allowed_extensions))}",
+                detail=(
+                    "File must have an extension. "
+                    f"Allowed types: {settings.allowed_extensions_display}"
+                ),
             )
 
         # Edge case: Invalid extension
         if file_ext not in settings.allowed_extensions:
-            logger.warning(f"Invalid file extension attempted: {file_ext}")
+            logger.warning("Invalid file extension attempted: %s", file_ext)
             raise HTTPException(
                 status_code=400,
                 detail=(
                     f"Invalid file type '{file_ext}'. "
-                    f"Allowed types: {', '.join(sorted(settings.allowed_extensions))}"
+                    f"Allowed types: {settings.allowed_extensions_display}"
                 ),
             )
 
         # Edge case: Check file size if available (before upload completes)
-        if hasattr(file, "size") and file.size is not None:
-            if file.size <= 0:
+        if size is not None:
+            if size <= 0:
                 raise HTTPException(
                     status_code=400, detail="File size is zero. Please upload a valid audio file."
                 )
-            if file.size > settings.max_file_size_bytes:
-                max_size_mb = settings.max_file_size_mb
-                raise HTTPException(
-                    status_code=413,
-                    detail=(
-                        f"File too large. Maximum size: {max_size_mb}MB. "
-                        f"Your file: {file.size / (1024 * 1024):.2f}MB"
-                    ),
-                )
+            self._check_upload_size(size)
 
         return file_ext
 
-    def save_upload(self, file: UploadFile, destination: Path) -> None:
+    async def save_upload(self, file: UploadFile, destination: Path) -> str | None:
+        """
+        Streams the uploaded file to disk with validation.
+
+        All of the file work (checks, copy, rename, verification) runs in one threadpool
+        call, so none of its syscalls block the event loop.
+
+        Args:
+            file: The uploaded file
+            destination: Path where to save the file
+
+        Returns:
+            Hex content digest of the upload, or None if the result cache is disabled
+
+        Raises:
+            HTTPException: If save fails or file is invalid
         """
-        Saves the uploaded file to disk with validation.
+        return await run_in_threadpool(self._store_upload, file, destination)
+
+    def _store_upload(self, file: UploadFile, destination: Path) -> str | None:
+        """
+        Copies the uploaded file to disk with validation (blocking operation).
+
+        The body is copied to a temporary ``.part`` file next to the destination, which
+        is renamed into place once complete. Uploads Starlette has already spooled to
+        disk are copied in the kernel, without passing through Python; others are copied
+        through a single reused 1 MiB buffer, so memory use stays bounded. When the
+        result cache is enabled, the content is hashed on the way.
 
         Args:
             file: The uploaded file
             destination: Path where to save the file
 
+        Returns:
+            Hex content digest of the upload, or None if the result cache is disabled
+
         Raises:
             HTTPException: If save fails or file is invalid
         """
+        # Partial upload; only renamed to destination once fully written
+        partial_path = destination.with_name(f"{destination.name}.part")
+        hasher = _new_content_hasher()
+
+        try:
+            self._prepare_upload(destination)
+
+            spooled_fd = self._spooled_fileno(file)
+            if spooled_fd is not None:
+                # Upload already spooled to disk: copy it in the kernel
+                # (copy_file_range, else sendfile)
+                bytes_written = os.fstat(spooled_fd).st_size
+                self._check_upload_size(bytes_written)
+                try:
+                    self._sendfile_copy(spooled_fd, partial_path, bytes_written)
+                except OSError as e:
+                    # Edge case: Filesystem that sendfile cannot copy between
+                    if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                        raise
+                    logger.debug("sendfile unavailable (%s), copying upload in userspace", e)
+                    bytes_written = self._copy_upload(file.file, partial_path, hasher)
+                else:
+                    if hasher is not None and bytes_written:
+                        # The kernel copy never surfaces the data; hash the spooled file
+                        # through a read-only mapping, in one call with no buffer copies
+                        with mmap.mmap(spooled_fd, 0, access=mmap.ACCESS_READ) as mapped:
+                            hasher.update(mapped)
+            else:
+                # The request body is fully received by now, so the size is checked once
+                # after a single C-level copy rather than per chunk
+                bytes_written = self._copy_upload(file.file, partial_path, hasher)
+                self._check_upload_size(bytes_written)
+
+            # Edge case: Empty file (the size limit was already enforced above)
+            if bytes_written == 0:
+                logger.warning("Uploaded file %s is empty", destination)
+                raise HTTPException(
+                    status_code=400,
+                    detail="Uploaded file is empty. Please upload a valid audio file.",
+                )
+
+            os.replace(partial_path, destination)
+            logger.info("File saved successfully: %s (%d bytes)", destination, bytes_written)
+            return hasher.hexdigest() if hasher is not None else None
+
+        except HTTPException:
+            self._remove_partial(partial_path)
+            raise
+        except PermissionError as e:
+            logger.error("Permission denied saving file %s: %s", destination, e, exc_info=True)
+            self._remove_partial(partial_path)
+            raise HTTPException(
+                status_code=500, detail="Permission denied. Please check server configuration."
+            ) from e
+        except OSError as e:
+            logger.error("Failed to save file %s: %s", destination, e, exc_info=True)
+            # Clean up partial file
+            self._remove_partial(partial_path)
+            raise HTTPException(
+                status_code=500, detail="Failed to save uploaded file. Please try again."
+            ) from e
+        except Exception as e:
+            logger.error("Unexpected error saving file %s: %s", destination, e, exc_info=True)
+            # Clean up partial file
+            self._remove_partial(partial_path)
+            raise HTTPException(
+                status_code=500, detail="An unexpected error occurred while saving the file."
+            ) from e
+
+    @staticmethod
+    def _prepare_upload(destination: Path) -> None:
+        """
+        Check disk space and permissions for an upload and clear its destination.
+
+        Raises:
+            HTTPException: If there is not enough disk space or no write permission
+            OSError: If the upload directory cannot be created
+        """
         # Edge case: Check disk space before saving (rough estimate)
         try:
-            statvfs = os.statvfs(settings.upload_dir)
-            free_space = statvfs.f_frsize * statvfs.f_bavail
+            free_space = _cached_free_space(settings.upload_dir)
             # Reserve at least 200MB free space (lowered for testing)
             min_free_space = 200 * 1024 * 1024
             if free_space < min_free_space:
@@ -123,118 +561,208 @@ class SpleeterService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.warning(f"Could not check disk space: {e}")
-
-        # Edge case: File already exists (shouldn't happen with UUID, but handle it)
-        if destination.exists():
-            logger.warning(f"File already exists, removing: {destination}")
-            try:
-                destination.unlink()
-            except Exception as e:
-                logger.error(f"Failed to remove existing file: {e}")
+            logger.warning("Could not check disk space: %s", e)
 
+        # Edge case: File already exists (shouldn't happen with UUID, but handle it).
+        # Unlinking directly costs one syscall in the usual case where it does not
         try:
-            # Ensure parent directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.unlink(destination)
+            logger.warning("File already existed, removed: %s", destination)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("Failed to remove existing file: %s", e)
 
-            # Edge case: Check write permissions
-            if not os.access(destination.parent, os.W_OK):
-                raise HTTPException(
-                    status_code=500, detail="No write permission to upload directory."
-                )
+        # Ensure parent directory exists
+        upload_dir = destination.parent
+        os.makedirs(upload_dir, exist_ok=True)
+
+        # Edge case: Check write permissions
+        if not _is_writable_dir(upload_dir):
+            raise HTTPException(status_code=500, detail="No write permission to upload directory.")
 
-            # Save file with size tracking (optimized: larger chunk size for better I/O)
+    async def save_stream(self, chunks: AsyncIterator[bytes], destination: Path) -> str | None:
+        """
+        Writes a streamed request body to disk as it arrives, with validation.
+
+        Used for raw (non-multipart) uploads: chunks go from the request straight to
+        a temporary ``.part`` file, without being spooled and copied again first. They
+        are written (and hashed, for the result cache) from the threadpool in batches
+        of about UPLOAD_CHUNK_SIZE, and the size limit is enforced as data arrives.
+
+        Args:
+            chunks: The request body, e.g. Request.stream()
+            destination: Path where to save the file
+
+        Returns:
+            Hex content digest of the upload, or None if the result cache is disabled
+
+        Raises:
+            HTTPException: If save fails or the upload is empty, too large or interrupted
+        """
+        partial_path = destination.with_name(f"{destination.name}.part")
+        hasher = _new_content_hasher()
+
+        try:
+            await run_in_threadpool(self._prepare_upload, destination)
+            out = await run_in_threadpool(open, partial_path, "wb")
             bytes_written = 0
-            chunk_size = 64 * 1024  # 64KB chunks for better performance
-            with open(destination, "wb") as buffer:
-                while True:
-                    chunk = file.file.read(chunk_size)
-                    if not chunk:
-                        break
-                    # Edge case: Check size during upload
+            try:
+                pending: list[bytes] = []
+                pending_size = 0
+                async for chunk in chunks:
                     bytes_written += len(chunk)
-                    if bytes_written > settings.max_file_size_bytes:
-                        buffer.close()
-                        if destination.exists():
-                            destination.unlink()
-                        max_size_mb = settings.max_file_size_mb
-                        raise HTTPException(
-                            status_code=413,
-                            detail=(
-                                f"File too large. Maximum size: {max_size_mb}MB. "
-                                f"Uploaded: {bytes_written / (1024 * 1024):.2f}MB"
-                            ),
-                        )
-                    buffer.write(chunk)
-
-            logger.info(f"File saved successfully: {destination} ({bytes_written} bytes)")
+                    self._check_upload_size(bytes_written)
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if pending_size >= UPLOAD_CHUNK_SIZE:
+                        await run_in_threadpool(_write_batch, out, pending, hasher)
+                        pending = []
+                        pending_size = 0
+                if pending:
+                    await run_in_threadpool(_write_batch, out, pending, hasher)
+            finally:
+                await run_in_threadpool(out.close)
+
+            # Edge case: Empty body
+            if bytes_written == 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Uploaded file is empty. Please upload a valid audio file.",
+                )
+
+            await run_in_threadpool(os.replace, partial_path, destination)
+            logger.info("File saved successfully: %s (%d bytes)", destination, bytes_written)
+            return hasher.hexdigest() if hasher is not None else None
 
         except HTTPException:
+            await run_in_threadpool(self._remove_partial, partial_path)
             raise
+        except ClientDisconnect as e:
+            logger.warning("Client disconnected during upload to %s", destination)
+            await run_in_threadpool(self._remove_partial, partial_path)
+            raise HTTPException(status_code=400, detail="Upload was interrupted.") from e
         except PermissionError as e:
-            logger.error(f"Permission denied saving file {destination}: {e}", exc_info=True)
+            logger.error("Permission denied saving file %s: %s", destination, e, exc_info=True)
+            await run_in_threadpool(self._remove_partial, partial_path)
             raise HTTPException(
                 status_code=500, detail="Permission denied. Please check server configuration."
             ) from e
         except OSError as e:
-            logger.error(f"Failed to save file {destination}: {e}", exc_info=True)
-            # Clean up partial file
-            if destination.exists():
-                try:
-                    destination.unlink()
-                except Exception:
-                    pass
+            logger.error("Failed to save file %s: %s", destination, e, exc_info=True)
+            await run_in_threadpool(self._remove_partial, partial_path)
             raise HTTPException(
                 status_code=500, detail="Failed to save uploaded file. Please try again."
             ) from e
         except Exception as e:
-            logger.error(f"Unexpected error saving file {destination}: {e}", exc_info=True)
-            # Clean up partial file
-            if destination.exists():
-                try:
-                    destination.unlink()
-                except Exception:
-                    pass
+            logger.error("Unexpected error saving file %s: %s", destination, e, exc_info=True)
+            await run_in_threadpool(self._remove_partial, partial_path)
             raise HTTPException(
                 status_code=500, detail="An unexpected error occurred while saving the file."
             ) from e
+        except BaseException:
+            # Edge case: Cancelled mid-upload (e.g. at shutdown). Unlink directly, since
+            # awaiting the threadpool here could be cancelled again
+            self._remove_partial(partial_path)
+            raise
+
+    @staticmethod
+    def _spooled_fileno(file: UploadFile) -> int | None:
+        """
+        Return the descriptor of an upload Starlette has spooled to disk, if usable.
 
-        # Validate file size after save
+        Only on Linux, where sendfile accepts a regular file as its output. Uploads
+        still held in memory return None rather than forcing a rollover to disk.
+        """
+        if sys.platform != "linux":
+            return None
+        spooled = file.file
+        # Edge case: Small uploads stay in the SpooledTemporaryFile's memory buffer
+        if not getattr(spooled, "_rolled", True):
+            return None
         try:
-            if not destination.exists():
-                raise HTTPException(status_code=500, detail="File was not saved correctly.")
+            return spooled.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+    @staticmethod
+    def _check_upload_size(size: int) -> None:
+        """Raise 413 if an upload of size bytes exceeds the configured maximum."""
+        # Only the comparison runs on the happy path; the message is built on rejection
+        if size > settings.max_file_size_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=(
+                    f"File too large. Maximum size: {settings.max_file_size_mb}MB. "
+                    f"Your file: {size / (1024 * 1024):.2f}MB"
+                ),
+            )
 
-            file_size = destination.stat().st_size
+    @staticmethod
+    def _copy_upload(source: BinaryIO, destination: Path, hasher: Any = None) -> int:
+        """
+        Copy an upload from its start to destination (blocking operation).
 
-            # Edge case: Empty file
-            if file_size == 0:
-                self.cleanup_files([destination])
-                logger.warning(f"Uploaded file {destination} is empty")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Uploaded file is empty. Please upload a valid audio file.",
-                )
+        Args:
+            source: The upload's file object
+            destination: Path to write the copy to
+            hasher: Optional hashlib object fed every chunk as it is copied
 
-            # Edge case: File too large (double-check)
-            if file_size > settings.max_file_size_bytes:
-                self.cleanup_files([destination])
-                max_size_mb = settings.max_file_size_mb
-                raise HTTPException(
-                    status_code=413,
-                    detail=(
-                        f"File too large. Maximum size: {max_size_mb}MB. "
-                        f"Your file: {file_size / (1024 * 1024):.2f}MB"
-                    ),
-                )
+        Returns:
+            Number of bytes written
+        """
+        # SpooledTemporaryFile only gained readinto in Python 3.11; read its buffer directly
+        source = getattr(source, "_file", source)
+        source.seek(0)
+        # Read into one reusable buffer instead of allocating a bytes object per chunk
+        buffer = memoryview(bytearray(UPLOAD_CHUNK_SIZE))
+        with open(destination, "wb") as out:
+            while n := source.readinto(buffer):
+                out.write(buffer[:n])
+                if hasher is not None:
+                    hasher.update(buffer[:n])
+            return out.tell()
+
+    @staticmethod
+    def _sendfile_copy(src_fd: int, destination: Path, size: int) -> None:
+        """
+        Copy size bytes from the start of src_fd to destination (blocking operation).
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error validating saved file {destination}: {e}", exc_info=True)
-            self.cleanup_files([destination])
-            raise HTTPException(status_code=500, detail="Error validating uploaded file.") from e
+        copy_file_range is tried first: besides copying in the kernel, it can share
+        extents on filesystems with reflinks or offload the copy to the storage. It
+        falls back to sendfile where unsupported (e.g. across filesystems on some
+        kernels).
+        """
+        copy_range = getattr(os, "copy_file_range", None)
+        _advise_sequential(src_fd)
+        with open(destination, "wb") as out:
+            out_fd = out.fileno()
+            offset = 0
+            while offset < size:
+                if copy_range is not None:
+                    try:
+                        # Writes at (and advances) out's file position, like sendfile
+                        sent = copy_range(src_fd, out_fd, size - offset, offset)
+                    except OSError as e:
+                        if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                            raise
+                        copy_range = None
+                        continue
+                else:
+                    sent = os.sendfile(out_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    raise OSError(f"Upload ended after {offset} of {size} bytes")
+                offset += sent
+
+    @staticmethod
+    def _remove_partial(path: Path) -> None:
+        """Remove a partially written upload, ignoring errors."""
+        try:
+            path.unlink(missing_ok=True)
+        except Exception:
+            pass
 
-    def _get_separator(self, stems: int) -> Separator:
+    def _get_separator(self, stems: int) -> "Separator":
         """
         Get or create a Separator instance (cached for performance).
 
@@ -246,273 +774,318 @@ class SpleeterService:
         """
         model_key = f"spleeter:{stems}stems"
 
-        # Check cache first
-        if model_key in _SEPARATOR_CACHE and _SEPARATOR_CACHE[model_key] is not None:
-            return _SEPARATOR_CACHE[model_key]
+        # Check cache first; a hit only needs the lock to update recency
+        separator = _SEPARATOR_CACHE.get(model_key)
+        if separator is not None:
+            with _SEPARATOR_CACHE_LOCK:
+                if model_key in _SEPARATOR_CACHE:
+                    _SEPARATOR_CACHE.move_to_end(model_key)
+            return separator
+
+        with _SEPARATOR_CACHE_LOCK:
+            # Edge case: Another thread loaded the model while we waited for the lock
+            separator = _SEPARATOR_CACHE.get(model_key)
+            if separator is not None:
+                _SEPARATOR_CACHE.move_to_end(model_key)
+                return separator
+            return self._load_separator(model_key)
 
-        # Configure TensorFlow to limit memory growth and prevent OOM
-        import tensorflow as tf
+    def _load_separator(self, model_key: str) -> "Separator":
+        """
+        Create a Separator and cache it, evicting the least recently used model.
 
-        # Limit TensorFlow memory growth to prevent OOM errors
-        gpus = tf.config.list_physical_devices("GPU")
-        if gpus:
-            try:
-                for gpu in gpus:
-                    tf.config.experimental.set_memory_growth(gpu, True)
-            except RuntimeError as e:
-                logger.warning(f"GPU memory growth setting failed: {e}")
+        Must be called with _SEPARATOR_CACHE_LOCK held.
 
-        # Limit TensorFlow to use only necessary memory
-        # This helps prevent crashes on Railway's limited memory
-        try:
-            # Set inter/intra op threads to reduce memory usage
-            tf.config.threading.set_inter_op_parallelism_threads(1)
-            tf.config.threading.set_intra_op_parallelism_threads(1)
-        except Exception as e:
-            logger.warning(f"Could not set TensorFlow threading: {e}")
+        Args:
+            model_key: Spleeter model descriptor, e.g. "spleeter:2stems"
+
+        Returns:
+            Separator instance
+        """
+        # No-op after the first call (workers configure TensorFlow in their initializer)
+        _configure_tensorflow_once()
+
+        from spleeter.separator import Separator
 
-        logger.info(f"Creating new Separator instance for {model_key}...")
+        logger.info("Creating new Separator instance for %s...", model_key)
         separator = Separator(model_key)
 
         # Cache the separator (but allow it to be cleared if needed)
         _SEPARATOR_CACHE[model_key] = separator
+        if len(_SEPARATOR_CACHE) > SEPARATOR_CACHE_SIZE:
+            # No clear_session() here: it is process-global and would also drop the
+            # state of the models that stay cached
+            evicted_key, _ = _SEPARATOR_CACHE.popitem(last=False)
+            logger.info("Evicted %s from separator cache", evicted_key)
 
         return separator
 
     def _clear_separator_cache(self) -> None:
         """Clear the separator cache to free memory."""
-        global _SEPARATOR_CACHE
-        for separator in _SEPARATOR_CACHE.values():
-            if separator is not None:
-                try:
-                    # Clean up TensorFlow resources
-                    del separator
-                except Exception as e:
-                    logger.warning(f"Error clearing separator: {e}")
-        _SEPARATOR_CACHE.clear()
+        with _SEPARATOR_CACHE_LOCK:
+            _SEPARATOR_CACHE.clear()
+            try:
+                # Clean up TensorFlow resources
+                import tensorflow as tf
+
+                tf.keras.backend.clear_session()
+            except Exception as e:
+                logger.warning("Error clearing separator: %s", e)
         logger.info("Separator cache cleared")
 
-    def run_separation(self, file_path: Path, stems: int) -> Path:
+    def run_separation_batch(
+        self, file_paths: list[Path], stems: int
+    ) -> list[Path | HTTPException]:
         """
-        Runs Spleeter separation (blocking operation).
+        Runs Spleeter separation for several files with one model (blocking operation).
+
+        Each file's stems are written asynchronously by Spleeter while the next file
+        is being separated, and the writers are joined once for the whole batch.
 
         Args:
-            file_path: Path to the audio file to separate
+            file_paths: Paths to the audio files to separate
             stems: Number of stems (2, 4, or 5)
 
         Returns:
-            Path to the output directory containing separated stems
-
-        Raises:
-            HTTPException: If separation fails
+            Per file, in order, the output directory or the HTTPException it failed with
         """
-        logger.info(f"Starting separation for {file_path} with {stems} stems")
+        logger.info("Starting batched separation of %s files with %s stems", len(file_paths), stems)
 
-        # Validate stems parameter
         if stems not in [2, 4, 5]:
-            raise HTTPException(
+            error = HTTPException(
                 status_code=400, detail=f"Invalid stems value: {stems}. Must be 2, 4, or 5."
             )
+            return [error] * len(file_paths)
 
         try:
-            # Step 1: Get or create separator (this loads the TensorFlow model)
-            # This can take 10-30 seconds on first load
-            logger.info(f"Loading TensorFlow model for {stems}-stem separation...")
             separator = self._get_separator(stems)
-            logger.info(f"TensorFlow model loaded successfully")
+        except Exception as e:
+            logger.error("Failed to load %s-stem model: %s", stems, e, exc_info=True)
+            error = HTTPException(
+                status_code=500, detail="Audio separation failed. Please try again."
+            )
+            return [error] * len(file_paths)
 
-            # Step 2: Run separation (this is the CPU-intensive part)
-            # This can take 30-120 seconds depending on file size
-            logger.info(f"Running audio separation for {file_path}...")
-            logger.info(f"This may take 30-120 seconds depending on file size...")
-            separator.separate_to_file(str(file_path), str(settings.output_dir))
-            logger.info(f"Separation completed for {file_path}")
+        # No locking: each pool worker runs one batch at a time, so nothing else uses
+        # this separator or its writer pool until the batch is joined
+        results: list[Path | HTTPException] = []
+        for file_path in file_paths:
+            try:
+                separator.separate_to_file(
+                    str(file_path),
+                    str(settings.output_dir),
+                    codec=settings.stem_codec,
+                    bitrate=settings.stem_bitrate,
+                    synchronous=False,
+                )
+                results.append(settings.output_dir / file_path.stem)
+            except Exception as e:
+                logger.error("Spleeter separation failed for %s: %s", file_path, e, exc_info=True)
+                results.append(
+                    HTTPException(
+                        status_code=500,
+                        detail=(
+                            "Audio separation failed. "
+                            "Please ensure the file is a valid audio file and try again."
+                        ),
+                    )
+                )
 
-        except ValueError as e:
-            logger.error(f"Invalid Spleeter configuration: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=400, detail=f"Invalid separation configuration: {str(e)}"
-            ) from e
+        # Wait for all stems of the batch to be written
+        try:
+            separator.join()
         except Exception as e:
-            logger.error(f"Spleeter separation failed for {file_path}: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=500,
-                detail=(
-                    "Audio separation failed. "
-                    "Please ensure the file is a valid audio file and try again."
-                ),
-            ) from e
-
-        # Verify output was created
-        output_folder_path = settings.output_dir / file_path.stem
-        if not output_folder_path.exists():
-            logger.error(f"Output folder {output_folder_path} not found after separation")
-            raise HTTPException(
-                status_code=500, detail="Separation completed but output files were not found."
-            )
+            logger.error("Writing separated stems failed: %s", e, exc_info=True)
+
+        for index, result in enumerate(results):
+            # Edge case: Writer failed or output is missing for this file
+            if isinstance(result, Path) and not os.path.isdir(result):
+                logger.error("Output folder %s not found after separation", result)
+                results[index] = HTTPException(
+                    status_code=500, detail="Separation completed but output files were not found."
+                )
 
-        logger.info(f"Separation output created at: {output_folder_path}")
-        return output_folder_path
+        return results
 
-    def create_zip(self, source_dir: Path, output_path: Path) -> None:
+    def validate_output(self, source_dir: Path) -> list[tuple[str, str, os.stat_result]]:
         """
-        Creates a zip archive from a directory (blocking operation).
+        Checks that a separation's output directory can be served (blocking operation).
 
         Args:
-            source_dir: Directory to zip
-            output_path: Path for the output zip file
+            source_dir: Directory containing the separated stems
+
+        Returns:
+            The directory's files as (path, arcname, stat), ready for zipping
 
         Raises:
-            HTTPException: If zip creation fails
+            HTTPException: If the directory is missing, empty or too large
         """
-        logger.info(f"Creating zip archive: {source_dir} -> {output_path}")
-
         # Edge case: Validate source directory exists
-        if not source_dir.exists():
+        if not source_dir.is_dir():
             raise HTTPException(
                 status_code=500, detail="Source directory does not exist for zip creation."
             )
 
-        if not source_dir.is_dir():
-            raise HTTPException(status_code=500, detail="Source path is not a directory.")
-
-        # Edge case: Check if directory is empty
+        entries: list[tuple[str, str, os.stat_result]] = []
+        total_size = 0
         try:
-            if not any(source_dir.iterdir()):
-                raise HTTPException(
-                    status_code=500, detail="Source directory is empty. No files to zip."
-                )
-        except PermissionError as e:
+            for entry in _scan_zip_entries(source_dir):
+                total_size += entry[2].st_size
+                entries.append(entry)
+        except OSError as e:
             raise HTTPException(
                 status_code=500, detail="Permission denied accessing source directory."
             ) from e
 
-        # Edge case: Output file already exists
-        if output_path.exists():
-            logger.warning(f"Output zip already exists, removing: {output_path}")
-            try:
-                output_path.unlink()
-            except Exception as e:
-                logger.error(f"Failed to remove existing zip: {e}")
-
-        # Ensure output directory exists
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-        except PermissionError as e:
+        if not entries:
             raise HTTPException(
-                status_code=500, detail="Permission denied creating output directory."
-            ) from e
+                status_code=500, detail="Source directory is empty. No files to zip."
+            )
+        # Prevent extremely large zips (safety limit)
+        if total_size > MAX_ZIP_SIZE_BYTES:
+            raise HTTPException(status_code=500, detail="Output zip file would be too large.")
 
-        # Edge case: Check write permissions
-        if not os.access(output_path.parent, os.W_OK):
-            raise HTTPException(status_code=500, detail="No write permission to output directory.")
+        return entries
 
-        try:
-            files_added = 0
-            total_size = 0
+    def stream_zip(self, source_dir: Path) -> Iterator[bytes]:
+        """
+        Streams a zip archive of a directory without writing the archive to disk.
 
-            # Optimized: Use Path objects and collect files first to reduce I/O
-            files_to_zip: list[tuple] = []
-            max_zip_size = 500 * 1024 * 1024  # 500MB
+        The directory is checked with validate_output before anything is streamed, so
+        errors still surface as HTTP errors; the returned iterator then yields the
+        archive in chunks of about UPLOAD_CHUNK_SIZE (blocking I/O, meant to be
+        iterated in a thread).
 
-            # Collect all files first (single walk)
-            for root, _, files in os.walk(source_dir):
-                for file_name in files:
-                    file_path = Path(root) / file_name
+        Args:
+            source_dir: Directory to zip
 
-                    # Edge case: Skip if file doesn't exist (race condition)
-                    if not file_path.exists():
-                        logger.warning(f"Skipping non-existent file: {file_path}")
-                        continue
+        Returns:
+            Iterator over the bytes of the zip archive
 
-                    # Edge case: Skip if not a file (symlink, etc.)
-                    if not file_path.is_file():
-                        logger.warning(f"Skipping non-file: {file_path}")
-                        continue
+        Raises:
+            HTTPException: If the directory is missing, empty or too large
+        """
+        logger.info("Streaming zip archive of %s", source_dir)
+        return self._iter_zip_chunks(self.validate_output(source_dir))
+
+    @staticmethod
+    def _iter_zip_chunks(entries: list[tuple[str, str, os.stat_result]]) -> Iterator[bytes]:
+        """Write entries into a zip on an unseekable sink, yielding bytes as they appear."""
+        deflate_pcm = settings.zip_compression == "deflated"
+        sink = _ZipChunkSink()
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as zipf:
+            for file_path, arcname, stat in entries:
+                zinfo = _zip_member_info(file_path, arcname, stat, deflate_pcm)
+                with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+                    for chunk in _read_ahead(src):
+                        dest.write(chunk)
+                        if data := sink.drain():
+                            yield data
+        # Remaining entry trailers and the central directory
+        if data := sink.drain():
+            yield data
+
+    @staticmethod
+    def _cached_result_path(digest: str, stems: int) -> Path:
+        """Directory of cached stems for an upload digest and stem count."""
+        # The stem format is part of the key, so changing it never serves stale results
+        return settings.result_cache_dir / (
+            f"{digest}_{stems}stems_{settings.stem_codec}_{settings.stem_bitrate}"
+        )
 
-                    # Edge case: Check file size before adding
-                    try:
-                        file_size = file_path.stat().st_size
-                        total_size += file_size
-
-                        # Prevent extremely large zips (safety limit)
-                        if total_size > max_zip_size:
-                            raise HTTPException(
-                                status_code=500, detail="Output zip file would be too large."
-                            )
-
-                        # Calculate relative path for archive
-                        try:
-                            arcname = file_path.relative_to(source_dir)
-                            # Edge case: Sanitize arcname to prevent zip slip
-                            if ".." in str(arcname):
-                                arcname = Path(file_name)
-                        except ValueError:
-                            # Fallback if relative path fails
-                            arcname = Path(file_name)
-
-                        files_to_zip.append((file_path, str(arcname)))
-                    except OSError as e:
-                        logger.warning(f"Could not get size for {file_path}: {e}")
-                        continue
+    def restore_cached_result(self, digest: str | None, stems: int, destination: Path) -> bool:
+        """
+        Link the stems of an earlier separation of the same audio into destination.
 
-            # Now create zip with collected files (optimized: single write operation)
-            with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file_path, arcname in files_to_zip:
-                    try:
-                        zipf.write(str(file_path), arcname)
-                        files_added += 1
-                    except (OSError, PermissionError) as e:
-                        logger.warning(f"Failed to add {file_path} to zip: {e}")
-                        # Continue with other files
-                        continue
+        The stems are hard-linked rather than served from the cache in place, so the
+        result stays intact for as long as the caller keeps it, even if the cache
+        entry is evicted meanwhile (blocking operation).
 
-            # Edge case: Check if any files were added
-            if files_added == 0:
-                if output_path.exists():
-                    output_path.unlink()
-                raise HTTPException(
-                    status_code=500, detail="No files were added to the zip archive."
-                )
+        Args:
+            digest: Content digest returned by save_upload/save_stream
+            stems: Number of stems
+            destination: Output directory to create, as separation would
 
-            logger.info(
-                f"Zip archive created successfully: {output_path} "
-                f"({files_added} files, {total_size / (1024 * 1024):.2f}MB)"
-            )
+        Returns:
+            True on a cache hit, False on a miss or if the cache is disabled
+        """
+        if digest is None:
+            return False
+        cached_dir = self._cached_result_path(digest, stems)
+        try:
+            # Bumps the mtime the cache is evicted by, and doubles as the existence check
+            os.utime(cached_dir)
+            _link_tree(cached_dir, destination)
+        except FileNotFoundError:
+            # Edge case: Not cached, or evicted while being linked
+            self._remove_tree(destination)
+            return False
+        except OSError as e:
+            logger.warning("Could not restore cached result %s: %s", cached_dir, e)
+            self._remove_tree(destination)
+            return False
+        logger.info("Result cache hit: %s", cached_dir)
+        return True
 
-        except HTTPException:
-            raise
-        except zipfile.BadZipFile as e:
-            logger.error(f"Invalid zip file created {output_path}: {e}", exc_info=True)
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                except Exception:
-                    pass
-            raise HTTPException(
-                status_code=500, detail="Failed to create valid zip archive."
-            ) from e
-        except (OSError, PermissionError) as e:
-            logger.error(f"Failed to create zip archive {output_path}: {e}", exc_info=True)
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                except Exception:
-                    pass
-            raise HTTPException(
-                status_code=500, detail="Failed to create zip archive. Please try again."
-            ) from e
-        except Exception as e:
-            logger.error(f"Unexpected error creating zip {output_path}: {e}", exc_info=True)
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                except Exception:
-                    pass
-            raise HTTPException(
-                status_code=500,
-                detail="An unexpected error occurred while creating the zip archive.",
-            ) from e
+    def cache_result(self, digest: str | None, stems: int, source_dir: Path) -> None:
+        """
+        Keep a separation's stems in the result cache (blocking operation).
+
+        The stem files are hard-linked into the cache, so no data is copied and no
+        archive is written. Failures are logged and otherwise ignored; the cache is
+        only an optimization. The least recently used entries beyond
+        result_cache_size are evicted.
+
+        Args:
+            digest: Content digest returned by save_upload/save_stream
+            stems: Number of stems
+            source_dir: Directory containing the separated stems
+        """
+        if digest is None:
+            return
+        cached_dir = self._cached_result_path(digest, stems)
+        # Unique per writer, so concurrent separations of the same audio cannot collide
+        partial_dir = cached_dir.with_name(
+            f"{cached_dir.name}.{os.getpid()}-{threading.get_ident()}.part"
+        )
+        try:
+            os.makedirs(settings.result_cache_dir, exist_ok=True)
+            _link_tree(source_dir, partial_dir)
+            os.rename(partial_dir, cached_dir)
+        except OSError as e:
+            # Edge case: Another request cached the same audio first (rename onto a
+            # non-empty directory fails); its entry is just as good
+            if not os.path.isdir(cached_dir):
+                logger.warning("Failed to cache result %s: %s", cached_dir, e)
+            self._remove_tree(partial_dir)
+            return
+        self._evict_cached_results()
+
+    def _evict_cached_results(self) -> None:
+        """Remove the least recently used cached results beyond result_cache_size."""
+        try:
+            with os.scandir(settings.result_cache_dir) as it:
+                cached = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if not entry.name.endswith(".part")
+                ]
+        except OSError as e:
+            logger.warning("Could not scan result cache: %s", e)
+            return
+
+        excess = len(cached) - settings.result_cache_size
+        if excess <= 0:
+            return
+        cached.sort()
+        for _, stale_path in cached[:excess]:
+            self._remove_tree(Path(stale_path))
+            logger.debug("Evicted cached result: %s", stale_path)
+
+    @staticmethod
+    def _remove_tree(path: Path) -> None:
+        """Remove a directory tree, ignoring errors."""
+        shutil.rmtree(path, ignore_errors=True)
 
     def cleanup_files(self, file_paths: list[Path]) -> None:
         """
@@ -521,16 +1094,242 @@ class SpleeterService:
         Args:
             file_paths: List of file or directory paths to remove
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         for path in file_paths:
+            # No exists()/is_dir() pre-checks: try the removal and let the error say
+            # what the path was, saving two stat calls per path
             try:
-                if path.exists():
-                    if path.is_dir():
-                        shutil.rmtree(path)
-                        logger.debug(f"Cleaned up directory: {path}")
-                    else:
-                        path.unlink()
-                        logger.debug(f"Cleaned up file: {path}")
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Failed to cleanup {path}: {e}")
+                try:
+                    shutil.rmtree(path)
+                    if debug:
+                        logger.debug("Cleaned up directory: %s", path)
+                except NotADirectoryError:
+                    os.unlink(path)
+                    if debug:
+                        logger.debug("Cleaned up file: %s", path)
+            except FileNotFoundError:
+                # Edge case: Already removed (or never created)
+                pass
+            except OSError as e:
+                logger.warning("Failed to cleanup %s: %s", path, e)
             except Exception as e:
-                logger.warning(f"Unexpected error cleaning up {path}: {e}", exc_info=True)
+                logger.warning("Unexpected error cleaning up %s: %s", path, e, exc_info=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_spleeter_service() -> SpleeterService:
+    """Return the process-wide SpleeterService, creating it on first use."""
+    return SpleeterService()
+
+
+def detect_cpu_quota() -> int:
+    """
+    Number of CPUs this process may actually use.
+
+    Honors the container CPU quota (cgroup v2, then v1) so TensorFlow does not size
+    its thread pools to the host's core count and get throttled by the CFS scheduler.
+
+    Returns:
+        Usable CPU count (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+
+    quota = None
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        quota_str, period_str = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota_str != "max":
+            quota = int(quota_str) / int(period_str)
+    except (OSError, ValueError):
+        try:
+            # cgroup v1: quota is -1 when unlimited
+            quota_us = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+            period_us = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+            if quota_us > 0 and period_us > 0:
+                quota = quota_us / period_us
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        cpus = min(cpus, int(quota))
+    return max(1, cpus)
+
+
+def detect_gpu_count() -> int:
+    """
+    Count the GPUs available to separation workers (0 for a CPU-only host).
+
+    Called in the API process, so it does not import TensorFlow (which would bring up
+    CUDA there): CUDA_VISIBLE_DEVICES is honored when set, otherwise the GPUs are
+    listed with nvidia-smi.
+    """
+    visible_devices = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible_devices is not None:
+        count = 0
+        for device in visible_devices.split(","):
+            device = device.strip()
+            # Edge case: CUDA ignores every entry from the first invalid one (e.g. "-1")
+            if not device or device.startswith("-"):
+                break
+            count += 1
+        return count
+
+    try:
+        result = subprocess.run(
+            ["nvidia-smi", "-L"], capture_output=True, text=True, timeout=10, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        # No NVIDIA driver installed (or it failed): separate on CPU
+        return 0
+    return sum(1 for line in result.stdout.splitlines() if line.startswith("GPU "))
+
+
+def _select_worker_gpu(worker_index: int, gpu_count: int) -> None:
+    """Make only this worker's GPU visible to TensorFlow, assigned round-robin."""
+    import tensorflow as tf
+
+    try:
+        gpus = tf.config.list_physical_devices("GPU")
+        if not gpus:
+            return
+        gpu = gpus[worker_index % min(gpu_count, len(gpus))]
+        tf.config.set_visible_devices(gpu, "GPU")
+        logger.info("Worker %s using %s", os.getpid(), gpu.name)
+    except Exception as e:
+        # Raised if the TensorFlow runtime was already initialized in this process
+        logger.warning("Could not select a GPU for worker %s: %s", os.getpid(), e)
+
+
+def configure_tf_threads(intra_op_threads: int) -> None:
+    """
+    Pin TensorFlow (and the OpenMP/MKL pools it uses) to a fixed number of threads.
+
+    Called by each separation worker before it imports TensorFlow, so the environment
+    variables are seen when the OpenMP/MKL runtimes load.
+
+    Args:
+        intra_op_threads: Threads used within a single op
+    """
+    threads = str(intra_op_threads)
+    os.environ["OMP_NUM_THREADS"] = threads
+    os.environ["MKL_NUM_THREADS"] = threads
+    os.environ["TF_NUM_INTRAOP_THREADS"] = threads
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+
+    import tensorflow as tf
+
+    try:
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    except Exception as e:
+        logger.warning("Could not set TensorFlow threading: %s", e)
+
+
+class SeparationError(Exception):
+    """Separation failure raised inside a worker process.
+
+    HTTPException does not survive pickling across the process boundary, so workers
+    raise this instead and the caller converts it back.
+    """
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _pin_worker_cpus(worker_index: int, cpu_count: int) -> None:
+    """Pin this process to its own block of CPUs, assigned round-robin by worker index."""
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        # CPU affinity is not available on macOS/Windows
+        return
+
+    if cpu_count >= len(cpus):
+        return
+    start = worker_index * cpu_count
+    block = {cpus[(start + i) % len(cpus)] for i in range(cpu_count)}
+    try:
+        os.sched_setaffinity(0, block)
+        logger.info("Worker %s pinned to CPUs %s", os.getpid(), sorted(block))
+    except OSError as e:
+        logger.warning("Could not set CPU affinity for worker %s: %s", os.getpid(), e)
+
+
+def init_separation_worker(
+    prewarm_stems: tuple[int, ...],
+    intra_op_threads: int,
+    worker_counter: Any,
+    gpu_count: int = 0,
+) -> None:
+    """
+    Initialize a separation worker process and pre-warm its models.
+
+    Args:
+        prewarm_stems: Stem counts whose models are loaded up front
+        intra_op_threads: TensorFlow intra-op threads for this worker
+        worker_counter: Shared multiprocessing.Value used to number workers
+        gpu_count: GPUs to spread workers across (0 runs on CPU)
+    """
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+    _pin_worker_cpus(worker_index, intra_op_threads)
+    # First, so the thread env vars are set before TensorFlow is imported
+    configure_tf_threads(intra_op_threads)
+    if gpu_count:
+        _select_worker_gpu(worker_index, gpu_count)
+    _configure_tensorflow_once()
+    service = get_spleeter_service()
+
+    try:
+        for stems in prewarm_stems:
+            logger.info("Pre-warming %s-stem model in worker %s...", stems, os.getpid())
+            service._get_separator(stems)
+        logger.info("Worker %s models pre-warmed successfully", os.getpid())
+    except Exception as e:
+        logger.warning("Model pre-warming failed in worker %s (non-critical): %s", os.getpid(), e)
+
+
+def warm_separation_worker() -> int:
+    """
+    No-op task whose submission makes the pool start a worker (and pre-warm its models).
+
+    Returns:
+        PID of the worker that ran it
+    """
+    return os.getpid()
+
+
+def run_separation_batch_in_worker(
+    file_paths: list[str], stems: int
+) -> list[str | SeparationError]:
+    """
+    Run a batch of separations with the same stem count inside a worker process.
+
+    Args:
+        file_paths: Paths to the audio files to separate
+        stems: Number of stems (2, 4, or 5)
+
+    Returns:
+        Per file, in order, the output directory or the SeparationError it failed with
+    """
+    service = get_spleeter_service()
+    results = service.run_separation_batch([Path(path) for path in file_paths], stems)
+    return [
+        (
+            SeparationError(result.status_code, str(result.detail))
+            if isinstance(result, HTTPException)
+            else str(result)
+        )
+        for result in results
+    ]
@@ -0,0 +1,12 @@
+"""Shared test setup: point every data directory at a throwaway location."""
+
+import os
+import tempfile
+
+# Settings are read when app.config is first imported, so this must run before any
+# test module imports the app
+_DATA_DIR = tempfile.mkdtemp(prefix="stem-splitter-tests-")
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_DATA_DIR, "uploads"))
+os.environ.setdefault("OUTPUT_DIR", os.path.join(_DATA_DIR, "output"))
+os.environ.setdefault("RESULT_CACHE_DIR", os.path.join(_DATA_DIR, "cache"))
+os.environ.setdefault("LOG_FILE", os.path.join(_DATA_DIR, "app.log"))
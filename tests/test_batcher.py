@@ -0,0 +1,79 @@
+"""Tests for SeparationBatcher: grouping by stem count and fanning out results."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from app import main
+from app.service import SeparationError
+
+
+@pytest.fixture
+def pool():
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def worker_calls(monkeypatch):
+    """Replace the worker entry point; files named "bad*" fail to separate."""
+    calls = []
+
+    def fake_worker(file_paths: list[str], stems: int) -> list:
+        calls.append((list(file_paths), stems))
+        return [
+            (
+                SeparationError(500, f"cannot separate {path}")
+                if Path(path).name.startswith("bad")
+                else f"{path}.out"
+            )
+            for path in file_paths
+        ]
+
+    monkeypatch.setattr(main, "run_separation_batch_in_worker", fake_worker)
+    return calls
+
+
+async def run_batcher(batcher: main.SeparationBatcher, *submissions):
+    """Queue every submission before the dispatcher starts, then gather the results."""
+    futures = [asyncio.ensure_future(batcher.submit(path, stems)) for path, stems in submissions]
+    await asyncio.sleep(0)
+    runner = asyncio.create_task(batcher.run())
+    try:
+        return await asyncio.gather(*futures, return_exceptions=True)
+    finally:
+        runner.cancel()
+
+
+async def test_batcher_fans_out_results_and_errors(pool, worker_calls):
+    batcher = main.SeparationBatcher(pool, max_workers=1, max_batch_size=4)
+
+    results = await run_batcher(
+        batcher,
+        (Path("a.wav"), 2),
+        (Path("bad.wav"), 2),
+        (Path("c.wav"), 4),
+        (Path("d.wav"), 2),
+    )
+
+    # Same stem counts share one worker call; the 4-stem file gets its own
+    assert worker_calls == [(["a.wav", "bad.wav", "d.wav"], 2), (["c.wav"], 4)]
+    assert results[0] == Path("a.wav.out")
+    assert isinstance(results[1], HTTPException)
+    assert results[1].status_code == 500
+    assert results[1].detail == "cannot separate bad.wav"
+    assert results[2] == Path("c.wav.out")
+    assert results[3] == Path("d.wav.out")
+
+
+async def test_batcher_fails_every_future_on_short_results(pool, monkeypatch):
+    monkeypatch.setattr(main, "run_separation_batch_in_worker", lambda paths, stems: [])
+    batcher = main.SeparationBatcher(pool, max_workers=1, max_batch_size=4)
+
+    results = await run_batcher(batcher, (Path("a.wav"), 2), (Path("b.wav"), 2))
+
+    assert all(isinstance(result, RuntimeError) for result in results)
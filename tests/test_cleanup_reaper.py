@@ -0,0 +1,41 @@
+"""Tests for the heap-based cleanup of job files."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app import main
+
+
+@pytest.fixture
+def removed(monkeypatch):
+    """Give each test an empty schedule and record cleanups instead of deleting files."""
+    monkeypatch.setattr(main, "_cleanup_heap", [])
+    monkeypatch.setattr(main, "_cleanup_wakeup", asyncio.Event())
+    calls = []
+    monkeypatch.setattr(main.spleeter_service, "cleanup_files", calls.append)
+    return calls
+
+
+async def wait_for_cleanups(removed: list, count: int) -> None:
+    while len(removed) < count:
+        await asyncio.sleep(0.01)
+
+
+async def test_cleanups_run_in_due_order(removed):
+    reaper = asyncio.create_task(main.cleanup_reaper())
+    try:
+        main.schedule_cleanup("late", [Path("late")], 0.5)
+        # Let the reaper go to sleep until the late deadline
+        await asyncio.sleep(0.01)
+        # An earlier deadline wakes it before the one it is sleeping on
+        main.schedule_cleanup("early", [Path("early")], 0.05)
+
+        await asyncio.wait_for(wait_for_cleanups(removed, 1), 0.4)
+        assert removed == [[Path("early")]]
+
+        await asyncio.wait_for(wait_for_cleanups(removed, 2), 2)
+        assert removed == [[Path("early")], [Path("late")]]
+    finally:
+        reaper.cancel()
@@ -0,0 +1,23 @@
+"""Tests for Settings validation and derived values."""
+
+from pathlib import Path
+
+from app.config import Settings
+
+
+def test_directories_are_resolved_to_absolute_paths():
+    config = Settings(upload_dir="rel/uploads", _env_file=None)
+
+    assert config.upload_dir.is_absolute()
+    assert config.upload_dir == Path("rel/uploads").resolve()
+
+
+def test_max_file_size_bytes_follows_the_mb_setting():
+    assert Settings(max_file_size_mb=3, _env_file=None).max_file_size_bytes == 3 * 1024 * 1024
+
+
+def test_allowed_extensions_are_normalized():
+    config = Settings(allowed_extensions={"MP3", ".Wav", "flac"}, _env_file=None)
+
+    assert config.allowed_extensions == frozenset({".mp3", ".wav", ".flac"})
+    assert config.allowed_extensions_display == ".flac, .mp3, .wav"
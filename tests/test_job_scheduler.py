@@ -0,0 +1,59 @@
+"""Tests for JobScheduler: bounded concurrency and graceful shutdown."""
+
+import asyncio
+
+import pytest
+
+from app.main import JobScheduler
+
+
+async def test_jobs_beyond_the_limit_wait_for_a_slot():
+    scheduler = JobScheduler(limit=2)
+    running = 0
+    peak = 0
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for index in range(5):
+        scheduler.spawn(job(), name=f"job-{index}")
+    await scheduler.close(timeout=5)
+
+    assert peak == 2
+    assert running == 0
+
+
+async def test_close_cancels_jobs_still_running_at_the_deadline():
+    scheduler = JobScheduler(limit=2)
+    finished = []
+    cancelled = []
+
+    async def job(delay: float):
+        try:
+            await asyncio.sleep(delay)
+            finished.append(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+
+    scheduler.spawn(job(0), name="quick")
+    scheduler.spawn(job(60), name="stuck")
+    await scheduler.close(timeout=0.1)
+
+    assert finished == [0]
+    assert cancelled == [60]
+
+
+async def test_closed_scheduler_rejects_jobs():
+    scheduler = JobScheduler(limit=1)
+    await scheduler.close(timeout=1)
+
+    async def job():
+        pass
+
+    with pytest.raises(RuntimeError):
+        scheduler.spawn(job(), name="late")
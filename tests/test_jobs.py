@@ -0,0 +1,129 @@
+"""Tests for the journal-backed JobManager: delta records, replay and compaction."""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app import jobs
+from app.jobs import JobManager, JobStatus
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    """Give each test its own job storage directory and journal."""
+    monkeypatch.setattr(jobs, "JOBS_STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "JOURNAL_PATH", tmp_path / "journal.jsonl")
+    return tmp_path
+
+
+@pytest.fixture
+def make_manager(journal_dir):
+    """Create JobManagers that are closed at the end of the test."""
+    managers = []
+
+    def make() -> JobManager:
+        manager = JobManager()
+        manager._persist = True
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager._close_journal()
+
+
+def read_journal() -> list[dict]:
+    return [orjson.loads(line) for line in jobs.JOURNAL_PATH.read_bytes().splitlines()]
+
+
+async def test_updates_are_journaled_as_deltas(make_manager):
+    manager = make_manager()
+    job = await manager.create_job(Path("song.wav"), 2)
+    manager.flush()
+    await manager.update_job_status(job.job_id, JobStatus.PROCESSING, progress=0.5)
+    manager.flush()
+
+    full_record, delta = read_journal()
+    assert full_record["file_path"] == "song.wav"
+    assert "file_path" not in delta
+    assert delta["status"] == "processing"
+    assert delta["progress"] == 0.5
+
+
+async def test_replay_skips_truncated_final_line(make_manager):
+    manager = make_manager()
+    job = await manager.create_job(Path("song.wav"), 4)
+    await manager.update_job_status(job.job_id, JobStatus.PROCESSING, progress=0.3)
+    manager.flush()
+    manager._close_journal()
+    # A crash mid-write leaves a torn record at the end of the journal
+    with open(jobs.JOURNAL_PATH, "ab") as f:
+        f.write(b'{"job_id": "' + job.job_id.encode() + b'", "status": "comp')
+
+    restored = await make_manager().get_job(job.job_id)
+
+    assert restored is not None
+    assert restored.status == JobStatus.PROCESSING
+    assert restored.progress == 0.3
+    assert restored.stems == 4
+
+
+async def test_compaction_keeps_one_record_per_live_job(make_manager, monkeypatch):
+    monkeypatch.setattr(jobs, "JOURNAL_COMPACT_THRESHOLD", 5)
+    manager = make_manager()
+    kept = await manager.create_job(Path("kept.wav"), 2)
+    removed = await manager.create_job(Path("removed.wav"), 2)
+    await manager.update_job_status(removed.job_id, JobStatus.FAILED, error="boom")
+    # Expire the failed job, which journals a deletion record
+    manager._cleanup_interval = -1
+    assert manager.cleanup_old_jobs() == 1
+    for step in range(1, 10):
+        await manager.update_job_status(kept.job_id, JobStatus.PROCESSING, progress=step / 10)
+        manager.flush()
+
+    records = read_journal()
+    assert len(records) <= 5
+    assert {record["job_id"] for record in records} == {kept.job_id}
+
+    replayed = make_manager()
+    assert await replayed.get_job(removed.job_id) is None
+    restored = await replayed.get_job(kept.job_id)
+    assert restored.status == JobStatus.PROCESSING
+    assert restored.progress == 0.9
+
+
+async def test_terminal_states_are_synced(make_manager, monkeypatch):
+    synced = []
+    monkeypatch.setattr(jobs, "_datasync", synced.append)
+    manager = make_manager()
+    job = await manager.create_job(Path("song.wav"), 2)
+
+    await manager.update_job_status(job.job_id, JobStatus.PROCESSING, progress=0.5)
+    assert synced == []
+
+    await manager.update_job_status(job.job_id, JobStatus.COMPLETED)
+    assert synced == [manager._journal_fd]
+    # The terminal record is already on disk, without waiting for the flusher
+    assert read_journal()[-1]["status"] == "completed"
+
+
+async def test_compaction_keeps_other_workers_records(make_manager):
+    # Two API workers share one journal
+    first = make_manager()
+    second = make_manager()
+    first_job = await first.create_job(Path("first.wav"), 2)
+    first.flush()
+    second_job = await second.create_job(Path("second.wav"), 2)
+    second.flush()
+
+    first._compact_journal()
+    # The second worker's descriptor still points at the replaced file
+    await second.update_job_status(second_job.job_id, JobStatus.PROCESSING, progress=0.5)
+    second.flush()
+
+    replayed = make_manager()
+    assert await replayed.get_job(first_job.job_id) is not None
+    restored = await replayed.get_job(second_job.job_id)
+    assert restored is not None
+    assert restored.progress == 0.5
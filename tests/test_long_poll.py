@@ -0,0 +1,56 @@
+"""Tests for long-polling /jobs/{job_id}/status."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app import main
+from app.jobs import JobManager, JobStatus
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = JobManager()
+    manager._persist = False
+    monkeypatch.setattr(main, "job_manager", manager)
+    return manager
+
+
+async def test_wait_answers_as_soon_as_the_job_changes(manager):
+    job = await manager.create_job(Path("song.wav"), 2)
+
+    async def start_processing():
+        await asyncio.sleep(0.05)
+        await manager.update_job_status(job.job_id, JobStatus.PROCESSING, progress=0.5)
+
+    updater = asyncio.create_task(start_processing())
+    started = time.monotonic()
+    response = await main.get_job_status(job.job_id, wait=10)
+    await updater
+
+    assert time.monotonic() - started < 5
+    body = orjson.loads(response.body)
+    assert body["job"]["status"] == "processing"
+    assert body["job"]["progress"] == 0.5
+
+
+async def test_wait_times_out_with_the_unchanged_job(manager):
+    job = await manager.create_job(Path("song.wav"), 2)
+
+    response = await main.get_job_status(job.job_id, wait=0.05)
+
+    assert orjson.loads(response.body)["job"]["status"] == "pending"
+
+
+async def test_finished_jobs_answer_without_waiting(manager):
+    job = await manager.create_job(Path("song.wav"), 2)
+    await manager.update_job_status(job.job_id, JobStatus.FAILED, error="boom")
+
+    started = time.monotonic()
+    response = await main.get_job_status(job.job_id, wait=10)
+
+    assert time.monotonic() - started < 5
+    assert orjson.loads(response.body)["job"]["status"] == "failed"
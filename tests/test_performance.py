@@ -0,0 +1,39 @@
+"""Tests for the per-function performance statistics."""
+
+import pytest
+
+from app import performance
+from app.config import settings
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Track calls into a fresh, small history."""
+    monkeypatch.setattr(settings, "enable_perf_tracking", True)
+    monkeypatch.setattr(performance, "PERFORMANCE_HISTORY_SIZE", 8)
+    monkeypatch.setattr(performance, "_performance_metrics", {})
+
+
+def test_count_covers_every_call_while_timings_use_the_recent_sample(metrics):
+    @performance.track_performance
+    def tracked():
+        pass
+
+    for _ in range(20):
+        tracked()
+
+    (stats,) = performance.get_performance_stats().values()
+    assert stats["count"] == 20
+    assert stats["sample_size"] == 8
+    assert stats["total_time"] == pytest.approx(stats["avg_time"] * 8)
+
+
+def test_reset_clears_the_history(metrics):
+    @performance.track_performance
+    def tracked():
+        pass
+
+    tracked()
+    performance.reset_performance_stats()
+
+    assert performance.get_performance_stats() == {}
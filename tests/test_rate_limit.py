@@ -0,0 +1,39 @@
+"""Tests for the client key used by the rate limiter."""
+
+import pytest
+from starlette.requests import Request
+
+from app import main
+
+
+def make_request(forwarded_for: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"x-forwarded-for", forwarded_for.encode())],
+            "client": ("10.0.0.9", 4321),
+        }
+    )
+
+
+def test_forwarded_for_is_ignored_unless_trusted(monkeypatch):
+    monkeypatch.setattr(main, "_TRUST_FORWARDED_FOR", False)
+
+    assert main.rate_limit_key(make_request("203.0.113.7")) == "10.0.0.9"
+
+
+@pytest.mark.parametrize(
+    ("hops", "forwarded_for", "expected"),
+    [
+        # The client can prepend anything; only the proxy-added entries count
+        (1, "198.51.100.1, 203.0.113.7", "203.0.113.7"),
+        (2, "198.51.100.1, 203.0.113.7, 10.0.0.2", "203.0.113.7"),
+        # Fewer entries than hops: the leftmost was still added by a proxy
+        (3, "203.0.113.7, 10.0.0.2", "203.0.113.7"),
+    ],
+)
+def test_client_is_taken_from_the_trusted_hops(monkeypatch, hops, forwarded_for, expected):
+    monkeypatch.setattr(main, "_TRUST_FORWARDED_FOR", True)
+    monkeypatch.setattr(main, "_FORWARDED_FOR_HOPS", hops)
+
+    assert main.rate_limit_key(make_request(forwarded_for)) == expected
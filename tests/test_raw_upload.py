@@ -0,0 +1,44 @@
+"""Tests for raw (non-multipart) uploads to /separate/raw."""
+
+import httpx
+import pytest
+
+from app import main
+from app.config import settings
+
+
+@pytest.fixture
+def small_upload_limit(monkeypatch):
+    monkeypatch.setitem(settings.__dict__, "max_file_size_bytes", 1024)
+
+
+def api_client() -> httpx.AsyncClient:
+    # Plain ASGI calls, so startup (worker pool, model warm-up) never runs. httpx is
+    # pinned below the version Starlette's TestClient needs, so it is used directly.
+    return httpx.AsyncClient(app=main.app, base_url="http://test")
+
+
+async def test_raw_upload_rejects_oversized_content_length(small_upload_limit):
+    async with api_client() as client:
+        response = await client.post(
+            "/separate/raw", params={"filename": "song.wav", "stems": 2}, content=b"\0" * 2048
+        )
+
+    assert response.status_code == 413
+    assert not list(settings.upload_dir.glob("*"))
+
+
+async def test_raw_upload_rejects_oversized_streamed_body(small_upload_limit):
+    async def body():
+        # Chunked transfer: no Content-Length, so the limit is enforced while saving
+        for _ in range(4):
+            yield b"\0" * 512
+
+    async with api_client() as client:
+        response = await client.post(
+            "/separate/raw", params={"filename": "song.wav", "stems": 2}, content=body()
+        )
+
+    assert response.status_code == 413
+    # Neither the upload nor its partial file is left behind
+    assert not list(settings.upload_dir.glob("*"))
@@ -0,0 +1,88 @@
+"""Tests for the result cache keyed by upload content digest."""
+
+import os
+
+import pytest
+
+from app.config import settings
+from app.service import get_spleeter_service
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "result_cache_size", 2)
+    return tmp_path / "cache"
+
+
+def make_stems(directory, content: bytes):
+    """Create a fake separation output directory."""
+    directory.mkdir(parents=True)
+    (directory / "vocals.wav").write_bytes(content)
+    (directory / "accompaniment.wav").write_bytes(content * 2)
+    return directory
+
+
+def age(cache_dir, digest: str, seconds: float) -> None:
+    """Make a cache entry look last used the given number of seconds ago."""
+    (entry,) = cache_dir.glob(f"{digest}_*")
+    past = entry.stat().st_mtime - seconds
+    os.utime(entry, (past, past))
+
+
+def test_cache_hit_links_stems_into_destination(cache_dir, tmp_path):
+    service = get_spleeter_service()
+    source = make_stems(tmp_path / "out" / "first", b"abc")
+    service.cache_result("digest-a", 2, source)
+    destination = tmp_path / "out" / "second"
+
+    assert service.restore_cached_result("digest-a", 2, destination)
+
+    assert (destination / "vocals.wav").read_bytes() == b"abc"
+    assert (destination / "accompaniment.wav").read_bytes() == b"abcabc"
+    # Hard links: the cache holds no second copy of the data
+    assert (destination / "vocals.wav").stat().st_ino == (source / "vocals.wav").stat().st_ino
+
+
+def test_cache_miss(cache_dir, tmp_path):
+    service = get_spleeter_service()
+    service.cache_result("digest-a", 2, make_stems(tmp_path / "out" / "a", b"abc"))
+    destination = tmp_path / "out" / "restored"
+
+    # Different content, or the same content split into a different number of stems
+    assert not service.restore_cached_result("digest-b", 2, destination)
+    assert not service.restore_cached_result("digest-a", 4, destination)
+    assert not service.restore_cached_result(None, 2, destination)
+    assert not destination.exists()
+
+
+def test_least_recently_used_entry_is_evicted(cache_dir, tmp_path):
+    service = get_spleeter_service()
+    service.cache_result("digest-a", 2, make_stems(tmp_path / "out" / "a", b"a"))
+    age(cache_dir, "digest-a", 20)
+    service.cache_result("digest-b", 2, make_stems(tmp_path / "out" / "b", b"b"))
+    age(cache_dir, "digest-b", 10)
+    # A hit makes "a" the most recently used entry
+    assert service.restore_cached_result("digest-a", 2, tmp_path / "out" / "a-hit")
+
+    service.cache_result("digest-c", 2, make_stems(tmp_path / "out" / "c", b"c"))
+
+    assert service.restore_cached_result("digest-a", 2, tmp_path / "out" / "a-again")
+    assert service.restore_cached_result("digest-c", 2, tmp_path / "out" / "c-hit")
+    assert not service.restore_cached_result("digest-b", 2, tmp_path / "out" / "b-miss")
+
+
+def test_restored_result_survives_eviction(cache_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_size", 1)
+    service = get_spleeter_service()
+    service.cache_result("digest-a", 2, make_stems(tmp_path / "out" / "a", b"a"))
+    destination = tmp_path / "out" / "job-result"
+    assert service.restore_cached_result("digest-a", 2, destination)
+    age(cache_dir, "digest-a", 10)
+
+    service.cache_result("digest-b", 2, make_stems(tmp_path / "out" / "b", b"b"))
+
+    assert not service.restore_cached_result("digest-a", 2, tmp_path / "out" / "a-miss")
+    # The job's own copy is untouched, so its download still works
+    assert (destination / "vocals.wav").read_bytes() == b"a"
+    assert service.validate_output(destination)